@@ -1,34 +1,16 @@
-import csv
-import os
 from collections import defaultdict
+from balance_columns import get_balance_columns
+from balance_snapshots import get_balance_snapshots
+from chart_of_accounts import ACCOUNT_TYPES, get_chart_of_accounts
+from money import parse_cents
+from transaction_store import get_store
 
 class AccountsManager:
-    def __init__(self):
-        self.account_types = {
-            # ASSETS
-            "Cash [ASSET]": "Assets",
-            "Accounts Receivable [ASSET]": "Assets", 
-            "Inventory [ASSET]": "Assets",
-            "Prepaid Expenses [ASSET]": "Assets",
-            "Equipment [ASSET]": "Assets",
-            
-            # LIABILITIES
-            "Accounts Payable [LIABILITY]": "Liabilities",
-            "Notes Payable [LIABILITY]": "Liabilities",
-            
-            # EQUITY
-            "Owner's Capital [EQUITY]": "Equities",
-            
-            # INCOME
-            "Sales Revenue [INCOME]": "Income",
-            "Service Revenue [INCOME]": "Income",
-            
-            # EXPENSES
-            "Cost of Goods Sold [EXPENSE]": "Expenses",
-            "Rent Expense [EXPENSE]": "Expenses",
-            "Salaries Expense [EXPENSE]": "Expenses",
-            "Utilities Expense [EXPENSE]": "Expenses"
-        }
+    def __init__(self, store=None):
+        self.store = store if store is not None else get_store()
+
+        self.chart = get_chart_of_accounts()
+        self.account_types = ACCOUNT_TYPES
         
         self.normal_balances = {
             "Assets": "Debit",
@@ -38,6 +20,12 @@ class AccountsManager:
             "Expenses": "Debit"
         }
 
+        # Balances (a list indexed by account ID) and per-type totals,
+        # kept up to date as transactions are posted
+        self._balances = None
+        self._type_totals = None
+        self.store.subscribe(self._on_store_change)
+
     def get_account_type(self, account_name):
         """Get the type of account (Asset, Liability, etc.)"""
         return self.account_types.get(account_name, "Unknown")
@@ -47,34 +35,74 @@ class AccountsManager:
         account_type = self.get_account_type(account_name)
         return self.normal_balances.get(account_type, "Unknown")
 
-    def calculate_account_balances(self):
-        """Calculate current balances for all accounts from transactions"""
-        balances = defaultdict(float)
-        
+    def _balances_by_id(self):
+        """Current balances in integer cents, as a list indexed by account ID"""
+        # One grouped sum over the account-ID and amount columns of the store's own rows, so
+        # the balances match the rows the views show even if another program shares the database
         try:
-            if not os.path.exists("transactions.csv"):
-                return balances
-                
-            with open("transactions.csv", mode="r", newline="", encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if all(key in row for key in ["Debit", "Credit", "Amount"]):
-                        debit_account = row["Debit"]
-                        credit_account = row["Credit"]
-                        amount = float(row["Amount"])
-                        
-                        # Add to debit account (increases asset/expense, decreases liability/equity/income)
-                        balances[debit_account] += amount
-                        
-                        # Subtract from credit account (increases liability/equity/income, decreases asset/expense)
-                        balances[credit_account] -= amount
-                        
+            return get_balance_columns(self.store).balances_by_id()
         except Exception as e:
             print(f"Error calculating balances: {e}")
-            
+            return [0] * len(self.chart)
+
+    def calculate_account_balances(self):
+        """Calculate current balances for all accounts from transactions, in integer cents"""
+        balances = defaultdict(int)
+        balances.update(zip(self.chart.names, self._balances_by_id()))
         return balances
 
-    def get_accounts_by_type(self):
+    def _adjust_balance(self, account_id, delta):
+        balances = self._balances
+        if account_id >= len(balances):
+            balances.extend([0] * (account_id + 1 - len(balances)))
+        old_balance = balances[account_id]
+        new_balance = old_balance + delta
+        balances[account_id] = new_balance
+
+        # Every account adds the size of its balance to its type's total
+        account_type = self.chart.types[account_id]
+        if account_type is not None:
+            self._type_totals[account_type] += abs(new_balance) - abs(old_balance)
+
+    def _on_store_change(self, event, row, index, key):
+        """Keep the cached balances in step with the transaction store"""
+        if self._balances is None:
+            return
+        if event == "reload":
+            self._balances = None
+            self._type_totals = None
+            return
+
+        try:
+            amount = parse_cents(row.amount)
+        except (TypeError, ValueError):
+            return
+        if event == "remove":
+            amount = -amount
+        self._adjust_balance(row.debit_id, amount)
+        self._adjust_balance(row.credit_id, -amount)
+
+    def get_account_balances(self):
+        """Current balances, computed once and then maintained per posted transaction"""
+        # Held across compute and assign: the background loader builds the
+        # cache, and a posting made meanwhile must wait for it rather than be
+        # skipped by _on_store_change while _balances is still None
+        with self.store.lock:
+            if self._balances is None:
+                balances = self._balances_by_id()
+                # Roll up by position: the chart knows each ID's type
+                type_totals = defaultdict(int)
+                for account_type, balance in zip(self.chart.types, balances):
+                    if account_type is not None:
+                        type_totals[account_type] += abs(balance)
+                self._balances = balances
+                self._type_totals = type_totals
+            # Names are attached only here, for display
+            balances = defaultdict(int)
+            balances.update(zip(self.chart.names, self._balances))
+            return balances
+
+    def get_accounts_by_type(self, balances=None):
         """Get all accounts organized by type"""
         accounts_by_type = {
             "Assets": [],
@@ -84,9 +112,10 @@ class AccountsManager:
             "Expenses": []
         }
         
-        balances = self.calculate_account_balances()
+        if balances is None:
+            balances = self.get_account_balances()
         for account_name, account_type in self.account_types.items():
-            balance = balances.get(account_name, 0.0)
+            balance = balances.get(account_name, 0)
             normal_balance = self.get_normal_balance(account_name)
             
             if normal_balance == "Credit" and balance < 0:
@@ -113,26 +142,58 @@ class AccountsManager:
         return accounts_by_type
 
     def get_total_by_type(self, account_type):
-        accounts = self.get_accounts_by_type().get(account_type, [])
-        total = 0.0
-        
-        for account in accounts:
-            if account["balance_type"] == "Debit":
-                total += account["balance"]
-            else:
-                total -= account["balance"]
-                
-        return abs(total)
+        with self.store.lock:
+            self.get_account_balances()
+            return abs(self._type_totals.get(account_type, 0))
+
+    def get_balances_as_of(self, as_of_date):
+        """Account balances for transactions up to as_of_date (YYYY-MM-DD), from month-end snapshots"""
+        return get_balance_snapshots(self.store).balances_as_of(as_of_date)
+
+    def get_all_accounts_summary(self, as_of_date=None):
+        """Per-account balances and per-type totals, now or as of a date"""
+        if as_of_date is None:
+            accounts_by_type = self.get_accounts_by_type()
+            totals = {account_type: self.get_total_by_type(account_type) for account_type in accounts_by_type}
+        else:
+            balances = self.get_balances_as_of(as_of_date)
+            accounts_by_type = self.get_accounts_by_type(balances)
+            totals = defaultdict(int)
+            for account_name, balance in balances.items():
+                account_type = self.account_types.get(account_name)
+                if account_type is not None:
+                    totals[account_type] += abs(balance)
 
-    def get_all_accounts_summary(self):
-        accounts_by_type = self.get_accounts_by_type()
         summary = {}
-        
         for account_type, accounts in accounts_by_type.items():
-            total = self.get_total_by_type(account_type)
             summary[account_type] = {
                 "accounts": accounts,
-                "total": total
+                "total": totals[account_type]
             }
             
         return summary
+
+    def get_balance_sheet_totals(self, summary=None):
+        """Balance sheet figures derived from an accounts summary"""
+        if summary is None:
+            summary = self.get_all_accounts_summary()
+
+        def total(account_type):
+            return summary.get(account_type, {"total": 0})["total"]
+
+        return {
+            "Assets": total("Assets"),
+            "Liabilities": total("Liabilities"),
+            "Equities": total("Equities"),
+            "Liabilities & Equity": total("Liabilities") + total("Equities"),
+            "Net Income": total("Income") - total("Expenses")
+        }
+
+    def get_balance_sheet(self, as_of_date=None):
+        """Balance sheet accounts per section and its totals, now or as of a date"""
+        summary = self.get_all_accounts_summary(as_of_date)
+        sections = {
+            section: summary.get(section, {"accounts": []})["accounts"]
+            for section in ("Assets", "Liabilities", "Equities")
+        }
+        return sections, self.get_balance_sheet_totals(summary)
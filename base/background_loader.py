@@ -0,0 +1,67 @@
+import queue
+import threading
+
+
+# Mag-load sa data sa laing thread samtang makita na ang window (Bisaya)
+class BackgroundLoader:
+    """Run a list of startup steps on a worker thread, reporting progress to Tk.
+
+    ``steps`` is a list of ``(label, func)`` pairs run in order on one
+    daemon thread. ``on_progress(done, total, label)`` is called on the Tk
+    thread as each step starts and once more when all are finished;
+    ``on_ready()`` follows when every step has succeeded, and
+    ``on_error(exc)`` if one raised. Messages travel through a queue that
+    the Tk thread polls with ``after()``, so no widget is touched from the
+    worker.
+    """
+
+    def __init__(self, widget, steps, on_progress=None, on_ready=None, on_error=None, poll_ms=50):
+        self.widget = widget
+        self.steps = list(steps)
+        self.on_progress = on_progress
+        self.on_ready = on_ready
+        self.on_error = on_error
+        self.poll_ms = poll_ms
+        self.ready = threading.Event()
+        self._messages = queue.Queue()
+        self._worker = None
+
+    def start(self):
+        """Start the worker and begin polling for its progress."""
+        if self._worker is not None:
+            return
+        self._worker = threading.Thread(target=self._work, daemon=True)
+        self._worker.start()
+        self.widget.after(self.poll_ms, self._poll)
+
+    def _work(self):
+        total = len(self.steps)
+        for done, (label, func) in enumerate(self.steps):
+            self._messages.put(("progress", (done, total, label)))
+            try:
+                func()
+            except Exception as e:
+                self._messages.put(("error", e))
+                return
+        self._messages.put(("progress", (total, total, "Ready")))
+        self._messages.put(("ready", None))
+
+    def _poll(self):
+        while True:
+            try:
+                kind, payload = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                if self.on_progress:
+                    self.on_progress(*payload)
+            elif kind == "error":
+                if self.on_error:
+                    self.on_error(payload)
+                return
+            else:
+                self.ready.set()
+                if self.on_ready:
+                    self.on_ready()
+                return
+        self.widget.after(self.poll_ms, self._poll)
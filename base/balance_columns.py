@@ -0,0 +1,164 @@
+from array import array
+from operator import attrgetter
+
+from chart_of_accounts import get_chart_of_accounts
+from money import parse_cents
+from transaction_store import get_store
+
+_numpy = None
+
+# np.add.at became fast in NumPy 1.25; older versions use np.bincount instead
+_FAST_ADD_AT = (1, 25)
+# np.bincount sums float64 weights, which are exact integers only below 2**53. Amounts are
+# split into low and high bits and summed in chunks, so every partial sum stays exact.
+_LOW_BITS = 26
+_BINCOUNT_CHUNK = 1 << (53 - _LOW_BITS)
+
+
+def get_numpy():
+    """NumPy, imported on first use so importing this module stays cheap; None if not installed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def _grouped_sum(np, ids, cents, count):
+    """Total of `cents` per ID in 0..count-1, as an int64 array.
+
+    np.add.at is an order of magnitude slower than np.bincount before
+    NumPy 1.25, and several times faster from then on.
+    """
+    totals = np.zeros(count, dtype=np.int64)
+    if tuple(int(part) for part in np.__version__.split(".")[:2]) >= _FAST_ADD_AT:
+        np.add.at(totals, ids, cents)
+        return totals
+    for start in range(0, len(cents), _BINCOUNT_CHUNK):
+        chunk_ids = ids[start:start + _BINCOUNT_CHUNK]
+        chunk = cents[start:start + _BINCOUNT_CHUNK]
+        high = np.bincount(chunk_ids, weights=chunk >> _LOW_BITS, minlength=count)
+        low = np.bincount(chunk_ids, weights=chunk & ((1 << _LOW_BITS) - 1), minlength=count)
+        totals += (high.astype(np.int64) << _LOW_BITS) + low.astype(np.int64)
+    return totals
+
+
+# Mga kolum sa account ID ug kantidad para paspas ang pag-total sa balances (Bisaya)
+class BalanceColumns:
+    """Debit/credit account IDs and integer-cent amounts as typed arrays.
+
+    Every row of the store is mirrored as one entry in three parallel
+    arrays; the account IDs are the rows' own chart-of-accounts IDs. With
+    the columns in place, all account balances come out of one grouped
+    sum with NumPy when it is installed, otherwise a tight loop over the
+    arrays.
+
+    The columns are built on first use and then kept up to date through the
+    store's change notifications, so amounts are parsed once per posting.
+    """
+
+    def __init__(self, store=None):
+        self.store = store if store is not None else get_store()
+        self.chart = get_chart_of_accounts()
+        self._built = False
+        self._clear()
+        self.store.subscribe(self._on_store_change)
+
+    def _clear(self):
+        self.debit_ids = array("i")
+        self.credit_ids = array("i")
+        self.cents = array("q")
+
+    def _append(self, row):
+        try:
+            cents = parse_cents(row.amount)
+        except (TypeError, ValueError):
+            print(f"Warning: Invalid amount counted as zero: {row}")
+            cents = 0
+        self.debit_ids.append(row.debit_id)
+        self.credit_ids.append(row.credit_id)
+        self.cents.append(cents)
+
+    def _build(self):
+        self._clear()
+        rows = self.store.get_rows()
+        self.debit_ids = array("i", map(attrgetter("debit_id"), rows))
+        self.credit_ids = array("i", map(attrgetter("credit_id"), rows))
+        try:
+            self.cents = array("q", map(parse_cents, map(attrgetter("amount"), rows)))
+        except (TypeError, ValueError):
+            self.cents = array("q")
+            for row in rows:
+                try:
+                    self.cents.append(parse_cents(row.amount))
+                except (TypeError, ValueError):
+                    print(f"Warning: Invalid amount counted as zero: {row}")
+                    self.cents.append(0)
+        self._built = True
+
+    def _on_store_change(self, event, row, index, key):
+        if not self._built:
+            return
+        if event == "add":
+            self._append(row)
+        elif event == "remove":
+            del self.debit_ids[index]
+            del self.credit_ids[index]
+            del self.cents[index]
+        else:
+            self._built = False
+            self._clear()
+
+    def balances_by_id(self, use_numpy=True):
+        """Debits minus credits in integer cents, as a list indexed by account ID."""
+        with self.store.lock:
+            if not self._built:
+                self._build()
+            count = len(self.chart)
+            np = get_numpy() if use_numpy else None
+            if np is not None:
+                cents = np.frombuffer(self.cents, dtype=np.int64)
+                totals = (_grouped_sum(np, np.frombuffer(self.debit_ids, dtype=np.intc), cents, count)
+                          - _grouped_sum(np, np.frombuffer(self.credit_ids, dtype=np.intc), cents, count))
+                totals = totals.tolist()
+            else:
+                totals = [0] * count
+                for debit_id, credit_id, cents in zip(self.debit_ids, self.credit_ids, self.cents):
+                    totals[debit_id] += cents
+                    totals[credit_id] -= cents
+            return totals
+
+    def posting_totals_by_id(self, use_numpy=True):
+        """Total debit postings and total credit postings in integer cents, two lists indexed by account ID."""
+        with self.store.lock:
+            if not self._built:
+                self._build()
+            count = len(self.chart)
+            np = get_numpy() if use_numpy else None
+            if np is not None:
+                cents = np.frombuffer(self.cents, dtype=np.int64)
+                debits = _grouped_sum(np, np.frombuffer(self.debit_ids, dtype=np.intc), cents, count)
+                credits = _grouped_sum(np, np.frombuffer(self.credit_ids, dtype=np.intc), cents, count)
+                return debits.tolist(), credits.tolist()
+            debits = [0] * count
+            credits = [0] * count
+            for debit_id, credit_id, cents in zip(self.debit_ids, self.credit_ids, self.cents):
+                debits[debit_id] += cents
+                credits[credit_id] += cents
+            return debits, credits
+
+    def account_balances(self, use_numpy=True):
+        """Debits minus credits per account name, in integer cents (0 for unused accounts)."""
+        return dict(zip(self.chart.names, self.balances_by_id(use_numpy)))
+
+
+def get_balance_columns(store=None):
+    """Return the BalanceColumns shared by every view of `store` (default: the shared store)."""
+    store = store if store is not None else get_store()
+    with store.lock:
+        if store.balance_columns is None:
+            store.balance_columns = BalanceColumns(store)
+        return store.balance_columns
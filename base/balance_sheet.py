@@ -1,10 +1,15 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from money import format_money
 
 
 # Nag-set up sa Balance Sheet tab nga adunay Assets ug Liabilities/Equity (Bisaya)
 def create_balance_sheet_tab(tab, accounts_manager):
-    """Render Balance Sheet tab with Assets and Liabilities & Equity containers."""
+    """Render Balance Sheet tab with Assets and Liabilities & Equity containers.
+
+    Returns the function that fills the tab in, for the caller to run once
+    the data is loaded.
+    """
     title_label = tk.Label(
         tab,
         text="📈 BALANCE SHEET",
@@ -14,6 +19,20 @@ def create_balance_sheet_tab(tab, accounts_manager):
     )
     title_label.pack(pady=(20, 10))
 
+    as_of_frame = tk.Frame(tab, bg="#f0f2f5")
+    as_of_frame.pack(pady=(0, 5))
+
+    tk.Label(
+        as_of_frame,
+        text="As of (YYYY-MM-DD, blank for today):",
+        font=("Segoe UI", 12),
+        bg="#f0f2f5",
+        fg="#2c3e50"
+    ).pack(side="left", padx=(0, 10))
+
+    as_of_entry = tk.Entry(as_of_frame, font=("Segoe UI", 12), width=14)
+    as_of_entry.pack(side="left")
+
     container = tk.Frame(tab, bg="#f0f2f5")
     container.pack(fill="both", expand=True, padx=20, pady=10)
 
@@ -90,47 +109,48 @@ def create_balance_sheet_tab(tab, accounts_manager):
                 for item in tree.get_children():
                     tree.delete(item)
 
-            summary = accounts_manager.get_all_accounts_summary()
-
-            assets_data = summary.get("Assets", {"accounts": [], "total": 0.0})
-            liabilities_data = summary.get("Liabilities", {"accounts": [], "total": 0.0})
-            equities_data = summary.get("Equities", {"accounts": [], "total": 0.0})
+            as_of_date = as_of_entry.get().strip() or None
+            sections, totals = accounts_manager.get_balance_sheet(as_of_date)
 
-            for account in assets_data["accounts"]:
+            for account in sections["Assets"]:
                 assets_tree.insert(
                     "",
                     "end",
-                    values=(account["name"], f"₱{account['balance']:,.2f}")
+                    values=(account["name"], f"₱{format_money(account['balance'])}")
                 )
 
             liabilities_tree.insert("", "end", values=("— Liabilities —", ""))
-            for account in liabilities_data["accounts"]:
+            for account in sections["Liabilities"]:
                 liabilities_tree.insert(
                     "",
                     "end",
-                    values=(account["name"], f"₱{account['balance']:,.2f}")
+                    values=(account["name"], f"₱{format_money(account['balance'])}")
                 )
 
             liabilities_tree.insert("", "end", values=("— Equity —", ""))
-            for account in equities_data["accounts"]:
+            for account in sections["Equities"]:
                 liabilities_tree.insert(
                     "",
                     "end",
-                    values=(account["name"], f"₱{account['balance']:,.2f}")
+                    values=(account["name"], f"₱{format_money(account['balance'])}")
                 )
 
-            assets_total_label.config(text=f"Total Assets: ₱{assets_data['total']:,.2f}")
-            liabilities_equity_total = liabilities_data["total"] + equities_data["total"]
+            assets_total_label.config(text=f"Total Assets: ₱{format_money(totals['Assets'])}")
             liabilities_total_label.config(
-                text=f"Total Liabilities & Equity: ₱{liabilities_equity_total:,.2f}"
+                text=f"Total Liabilities & Equity: ₱{format_money(totals['Liabilities & Equity'])}"
             )
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load balance sheet: {str(e)}")
 
+    def refresh_balance_sheet():
+        # Re-reads the transactions only if the file changed on disk
+        accounts_manager.store.refresh()
+        populate_balance_sheet()
+
     refresh_balance_btn = tk.Button(
         container,
         text="🔄 Refresh Balance Sheet",
-        command=populate_balance_sheet,
+        command=refresh_balance_sheet,
         font=("Segoe UI", 14, "bold"),
         bg="#3498db",
         fg="white",
@@ -144,5 +164,7 @@ def create_balance_sheet_tab(tab, accounts_manager):
     )
     refresh_balance_btn.pack(pady=(10, 0))
 
-    populate_balance_sheet()
+    as_of_entry.bind("<Return>", lambda event: populate_balance_sheet())
+
+    return populate_balance_sheet
 
@@ -0,0 +1,202 @@
+import json
+import os
+import zlib
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+from chart_of_accounts import get_chart_of_accounts
+from money import parse_cents
+from records import iso_date
+from transaction_store import get_store
+
+SNAPSHOT_FILENAME = "balance_snapshots.json"
+
+
+def _digest_line(row):
+    return f"{row.date}\x1f{row.debit}\x1f{row.credit}\x1f{row.amount}\n"
+
+
+def _row_cents(row):
+    try:
+        return parse_cents(row.amount)
+    except (TypeError, ValueError):
+        return 0
+
+
+# Balanse sa katapusan sa matag bulan para sa balance sheet sa bisan unsang petsa (Bisaya)
+class BalanceSnapshots:
+    """Month-end balances per account, for balance sheets as of any date.
+
+    For every month that has transactions, the closing balance of each
+    account (debits minus credits, integer cents, all history up to the end
+    of that month) is kept, keyed by chart-of-accounts ID in memory and by
+    account name on disk. Balances as of a date are the previous month's
+    closing balances plus a replay of that one month's transactions, so the
+    cost does not grow with the years of history before it.
+
+    Snapshots are updated as transactions are posted or deleted. When
+    `path` is given they are also saved there, together with a row count
+    and checksum per month, so the next start only has to recompute the
+    months whose transactions changed in the meantime.
+    """
+
+    def __init__(self, store=None, path=None):
+        self.store = store if store is not None else get_store()
+        self.path = path
+        self.chart = get_chart_of_accounts()
+        self._built = False
+        self._dirty = False
+        self._clear()
+        self.store.subscribe(self._on_store_change)
+
+    def _clear(self):
+        self._months = []
+        self._closing = {}
+        self._month_keys = defaultdict(list)
+        self._digests = {}
+
+    def _month_digest(self, month):
+        lines = (_digest_line(self.store.get_row(key)) for key in self._month_keys[month])
+        return [len(self._month_keys[month]), zlib.crc32("".join(lines).encode("utf-8"))]
+
+    def _load_saved(self):
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, mode="r", encoding="utf-8") as file:
+                saved = json.load(file)
+            return saved.get("months", {}) if saved.get("version") == 1 else {}
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring balance snapshots file: {e}")
+            return {}
+
+    def _build(self):
+        self._clear()
+        lines = defaultdict(list)
+        for key, row in self.store.get_items():
+            iso = iso_date(row.date)
+            if iso is None:
+                continue
+            month = iso[:7]
+            self._month_keys[month].append(key)
+            lines[month].append(_digest_line(row))
+        self._months = sorted(self._month_keys)
+        for month in self._months:
+            self._digests[month] = [len(lines[month]), zlib.crc32("".join(lines[month]).encode("utf-8"))]
+
+        # Saved months are reused up to the first one whose rows changed
+        saved = self._load_saved()
+        saved_months = sorted(saved)
+        closing = {}
+        recomputed = False
+        for position, month in enumerate(self._months):
+            entry = saved.get(month)
+            unchanged = (
+                position < len(saved_months) and saved_months[position] == month
+                and entry.get("digest") == self._digests[month]
+            )
+            if not recomputed and unchanged:
+                closing = {self.chart.id_of(name): cents for name, cents in entry["balances"].items()}
+            else:
+                recomputed = True
+                closing = dict(closing)
+                for key in self._month_keys[month]:
+                    self._apply(closing, self.store.get_row(key), 1)
+            self._closing[month] = closing
+        self._built = True
+        self._dirty = recomputed or set(saved) != set(self._months)
+        self.save()
+
+    def _apply(self, balances, row, sign):
+        amount = _row_cents(row) * sign
+        balances[row.debit_id] = balances.get(row.debit_id, 0) + amount
+        balances[row.credit_id] = balances.get(row.credit_id, 0) - amount
+
+    def _on_store_change(self, event, row, index, key):
+        if not self._built:
+            return
+        if event not in ("add", "remove"):
+            self._built = False
+            self._clear()
+            return
+        iso = iso_date(row.date)
+        if iso is None:
+            return
+        month = iso[:7]
+
+        if event == "add":
+            if month not in self._closing:
+                position = bisect_left(self._months, month)
+                previous = self._closing[self._months[position - 1]] if position else {}
+                insort(self._months, month)
+                self._closing[month] = dict(previous)
+            self._month_keys[month].append(key)
+            count, checksum = self._digests.get(month, (0, 0))
+            self._digests[month] = [count + 1, zlib.crc32(_digest_line(row).encode("utf-8"), checksum)]
+            sign = 1
+        else:
+            self._month_keys[month].remove(key)
+            self._digests[month] = self._month_digest(month)
+            sign = -1
+
+        # The month itself and every later month-end include this transaction
+        for later in self._months[bisect_left(self._months, month):]:
+            self._apply(self._closing[later], row, sign)
+        self._dirty = True
+
+    def save(self):
+        """Write the snapshots to `path`, if there is one and they changed."""
+        if not self.path or not self._dirty:
+            return
+        names = self.chart.names
+        months = {
+            month: {
+                "digest": self._digests[month],
+                "balances": {names[account_id]: cents for account_id, cents in self._closing[month].items()},
+            }
+            for month in self._months
+        }
+        try:
+            temp_name = self.path + ".tmp"
+            with open(temp_name, mode="w", encoding="utf-8") as file:
+                json.dump({"version": 1, "months": months}, file)
+            os.replace(temp_name, self.path)
+            self._dirty = False
+        except OSError as e:
+            print(f"❌ Error saving balance snapshots: {str(e)}")
+
+    def balances_as_of(self, as_of_date):
+        """Debits minus credits per account, in integer cents, for transactions up to `as_of_date`."""
+        target = iso_date(as_of_date)
+        if target is None:
+            raise ValueError("Date must be in YYYY-MM-DD format")
+        month = target[:7]
+
+        with self.store.lock:
+            if not self._built:
+                self._build()
+            position = bisect_left(self._months, month)
+            by_id = dict(self._closing[self._months[position - 1]]) if position else {}
+            # Replay only the requested month, up to and including the day
+            for key in self._month_keys.get(month, ()):
+                row = self.store.get_row(key)
+                if iso_date(row.date) <= target:
+                    self._apply(by_id, row, 1)
+            self.save()
+        names = self.chart.names
+        balances = defaultdict(int)
+        balances.update((names[account_id], cents) for account_id, cents in by_id.items())
+        return balances
+
+
+def get_balance_snapshots(store=None):
+    """Return the BalanceSnapshots shared by every view of `store` (default: the shared store).
+
+    Snapshots of a store with a storage backend are saved to SNAPSHOT_FILENAME.
+    """
+    store = store if store is not None else get_store()
+    with store.lock:
+        if store.balance_snapshots is None:
+            path = SNAPSHOT_FILENAME if store.backend is not None else None
+            store.balance_snapshots = BalanceSnapshots(store, path)
+        return store.balance_snapshots
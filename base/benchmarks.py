@@ -0,0 +1,642 @@
+"""Timing helpers for the accounting engine.
+
+Run from the base directory:
+
+    python benchmarks.py
+"""
+import random
+import time
+
+from accounts_manager import AccountsManager
+from general_journal import GeneralJournal
+from general_ledger import GeneralLedger
+from records import TransactionRow
+from transaction_store import TransactionStore
+
+ACCOUNTS = list(AccountsManager(store=TransactionStore.from_rows([])).account_types)
+
+
+def make_rows(count, seed=42):
+    """Generate `count` synthetic transactions as TransactionRows."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        debit, credit = rng.sample(ACCOUNTS, 2)
+        rows.append(TransactionRow(
+            f"20{20 + i % 6:02d}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+            f"Transaction {i}",
+            debit,
+            credit,
+            f"{rng.randint(1, 10_000_000) / 100:.2f}",
+        ))
+    return rows
+
+
+def _best_of(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark_accounts_summary(row_counts=(10_000, 50_000, 100_000, 200_000), repeat=3):
+    """Time get_all_accounts_summary at several ledger sizes.
+
+    Returns a list of (rows, seconds). The per-row cost printed next to each
+    size stays flat when the summary is a single pass over the transactions.
+    """
+    results = []
+    for count in row_counts:
+        store = TransactionStore.from_rows(make_rows(count))
+        # A fresh manager has no balance cache, so this times a full summary build
+        seconds = _best_of(lambda: AccountsManager(store=store).get_all_accounts_summary(), repeat)
+        results.append((count, seconds))
+        print(f"accounts summary  {count:>9,} rows  {seconds * 1000:9.2f} ms  "
+              f"{seconds / count * 1e6:6.3f} µs/row")
+    return results
+
+
+def benchmark_posting(history_sizes=(10_000, 100_000, 200_000), postings=1_000):
+    """Time posting, then deleting, transactions on top of ledgers of different sizes.
+
+    Balances, type totals, journal lines, the journal's date index and the
+    ledger running balance are all maintained in place, so the cost per
+    posting should not depend on how much history is already loaded.
+
+    Deletions are timed from the front, the worst case: every positional
+    cache (store rows, journal lines, ledger entries, balance columns)
+    shifts by one slot, so a deletion is O(n), though as a memmove rather
+    than a Python loop. The ledger's running balances are only marked stale
+    and recomputed in one pass when the ledger is next read; that read is
+    included in the timing.
+    """
+    results = []
+    new_rows = make_rows(postings, seed=7)
+    for count in history_sizes:
+        store = TransactionStore.from_rows(make_rows(count))
+        manager = AccountsManager(store=store)
+        GeneralJournal(store=store)
+        ledger = GeneralLedger(store=store)
+        manager.get_all_accounts_summary()
+
+        start = time.perf_counter()
+        for row in new_rows:
+            store.add(row)
+            manager.get_all_accounts_summary()
+        seconds = (time.perf_counter() - start) / postings
+
+        start = time.perf_counter()
+        for key in store.get_keys()[:postings]:
+            store.delete(key)
+            manager.get_all_accounts_summary()
+        ledger.get_all_entries()
+        delete_seconds = (time.perf_counter() - start) / postings
+        results.append((count, seconds, delete_seconds))
+        print(f"post + summary    {count:>9,} rows  {seconds * 1e6:9.2f} µs/posting  "
+              f"delete {delete_seconds * 1e6:9.2f} µs/deletion")
+    return results
+
+
+def benchmark_search(row_count=1_000_000, terms=("transaction 12345", "2023-04", "rent", "ca"), repeat=5):
+    """Time indexed substring searches against a linear scan of the rows."""
+    from search_index import SearchIndex
+
+    store = TransactionStore.from_rows(make_rows(row_count))
+    index = SearchIndex(store)
+    start = time.perf_counter()
+    index.search_keys("warm up")
+    print(f"search index build  {row_count:>9,} rows  {time.perf_counter() - start:9.2f} s")
+
+    rows = store.get_rows()
+    results = []
+    for term in terms:
+        indexed = _best_of(lambda: index.search_keys(term), repeat)
+        scanned = _best_of(lambda: [
+            row for row in rows
+            if any(term in value.lower() for value in row.values())
+        ], 1)
+        hits = len(index.search_keys(term))
+        results.append((term, hits, indexed, scanned))
+        print(f"search {term!r:<22} {hits:>9,} hits  index {indexed * 1000:9.3f} ms  "
+              f"scan {scanned * 1000:9.1f} ms")
+    return results
+
+
+def benchmark_columnar_load(row_count=1_000_000):
+    """Compare parsing transactions.csv with loading the columnar format."""
+    import os
+    import tempfile
+    from columnar_storage import load_columns, write_columns
+    from storage_backends import read_csv_rows, write_csv_rows
+
+    rows = make_rows(row_count)
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "transactions.csv")
+        columns_path = os.path.join(directory, "transactions.cols")
+        write_csv_rows(csv_path, rows)
+        write_columns(columns_path, rows)
+
+        timings = [
+            ("csv parse", lambda: read_csv_rows(csv_path)),
+            ("columns (copy)", lambda: load_columns(columns_path)),
+            ("columns (mmap)", lambda: load_columns(columns_path, mmap=True).close()),
+            ("columns -> rows", lambda: load_columns(columns_path).rows()),
+        ]
+        results = []
+        for label, func in timings:
+            seconds = _best_of(func, 3)
+            results.append((label, seconds))
+            print(f"load {label:<16} {row_count:>9,} rows  {seconds * 1000:9.1f} ms  "
+                  f"{row_count / seconds / 1e6:8.2f} M rows/s")
+    return results
+
+
+def benchmark_money(row_count=2_000_000, repeat=3):
+    """Compare float, Decimal and integer-cent amounts for exactness and speed.
+
+    Each approach parses the Amount strings and sums them. The exact total
+    comes from Decimal; float drifts away from it as the row count grows,
+    while integer cents stay exact.
+    """
+    from decimal import Decimal
+    from money import cents_to_str, parse_cents
+
+    amounts = [row.amount for row in make_rows(row_count)]
+    exact = sum(map(Decimal, amounts))
+
+    # Posting 0.10 over and over is the classic case float cannot represent
+    dimes = ["0.10"] * row_count
+    print(f"money {row_count:>9,} x 0.10  float {sum(map(float, dimes))!r}  "
+          f"cents {cents_to_str(sum(map(parse_cents, dimes)))}")
+
+    approaches = [
+        ("float", float, lambda total: Decimal(repr(total))),
+        ("Decimal", Decimal, lambda total: total),
+        ("int cents", parse_cents, lambda total: Decimal(total) / 100),
+    ]
+    results = []
+    for label, parse, to_decimal in approaches:
+        total = sum(map(parse, amounts))
+        seconds = _best_of(lambda: sum(map(parse, amounts)), repeat)
+        values = list(map(parse, amounts))
+        summing = _best_of(lambda: sum(values), repeat)
+        error = to_decimal(total) - exact
+        results.append((label, seconds, summing, error))
+        print(f"money {label:<10} {row_count:>9,} rows  parse+sum {row_count / seconds / 1e6:6.2f} M rows/s  "
+              f"sum {row_count / summing / 1e6:7.2f} M rows/s  error {error}")
+    return results
+
+
+def benchmark_vectorized_balances(row_count=1_000_000, repeat=3):
+    """Compare a per-row dictionary loop with the grouped sum over balance columns.
+
+    The row loop is how balances used to be computed; like it, the "cold"
+    timing parses every amount, since it builds fresh columns first. The
+    other column timings reuse the built columns, as every call after the
+    first load does.
+    """
+    from collections import defaultdict
+    from balance_columns import BalanceColumns, get_numpy, get_balance_columns
+    from money import parse_cents
+
+    store = TransactionStore.from_rows(make_rows(row_count))
+    rows = store.get_rows()
+
+    def row_loop():
+        balances = defaultdict(int)
+        for row in rows:
+            amount = parse_cents(row.amount)
+            balances[row.debit] += amount
+            balances[row.credit] -= amount
+        return balances
+
+    columns = get_balance_columns(store)
+    start = time.perf_counter()
+    expected = columns.account_balances(use_numpy=False)
+    print(f"balance columns build  {row_count:>9,} rows  {time.perf_counter() - start:9.2f} s")
+    assert {name: cents for name, cents in expected.items() if cents} == \
+        {name: cents for name, cents in row_loop().items() if cents}
+
+    def cold_columns():
+        fresh = BalanceColumns(store)
+        try:
+            return fresh.account_balances(use_numpy=False)
+        finally:
+            store.unsubscribe(fresh._on_store_change)
+
+    timings = [
+        ("row loop", row_loop),
+        ("columns (cold)", cold_columns),
+        ("columns (python)", lambda: columns.account_balances(use_numpy=False)),
+    ]
+    if get_numpy() is not None:
+        assert columns.account_balances() == expected
+        timings.append(("columns (numpy)", columns.account_balances))
+    else:
+        print("balances: NumPy is not installed, skipping the vectorized timing")
+
+    results = []
+    baseline = None
+    for label, func in timings:
+        seconds = _best_of(func, repeat)
+        baseline = baseline or seconds
+        results.append((label, seconds))
+        print(f"balances {label:<17} {row_count:>9,} rows  {seconds * 1000:9.1f} ms  "
+              f"{baseline / seconds:6.1f}x")
+    return results
+
+
+def benchmark_journal_date_range(row_count=1_000_000, ranges=(("2022-03-01", "2022-03-31"), ("2020-01-01", "2025-12-31")), repeat=3):
+    """Time journal date-range lookups against parsing every entry's date per call."""
+    from datetime import datetime
+
+    store = TransactionStore.from_rows(make_rows(row_count))
+    start = time.perf_counter()
+    journal = GeneralJournal(store=store)
+    print(f"journal load        {row_count:>9,} rows  {time.perf_counter() - start:9.2f} s")
+
+    def strptime_scan(start_date, end_date):
+        first = datetime.strptime(start_date, '%Y-%m-%d')
+        last = datetime.strptime(end_date, '%Y-%m-%d')
+        return [
+            entry for entry in journal.journal_entries
+            if entry.date and first <= datetime.strptime(entry.date, '%Y-%m-%d') <= last
+        ]
+
+    results = []
+    for start_date, end_date in ranges:
+        indexed = _best_of(lambda: journal.get_journal_entries_by_date_range(start_date, end_date), repeat)
+        scanned = _best_of(lambda: strptime_scan(start_date, end_date), 1)
+        lines = len(journal.get_journal_entries_by_date_range(start_date, end_date))
+        results.append(((start_date, end_date), lines, indexed, scanned))
+        print(f"journal {start_date}..{end_date} {lines:>9,} lines  index {indexed * 1000:9.2f} ms  "
+              f"scan {scanned * 1000:9.1f} ms")
+    return results
+
+
+def benchmark_balance_as_of(row_count=1_000_000, dates=("2022-03-15", "2025-12-31"), repeat=3):
+    """Time as-of balances from month-end snapshots against rescanning from day one."""
+    from collections import defaultdict
+    from balance_snapshots import BalanceSnapshots
+    from money import parse_cents
+
+    store = TransactionStore.from_rows(make_rows(row_count))
+    snapshots = BalanceSnapshots(store)
+    start = time.perf_counter()
+    snapshots.balances_as_of(dates[0])
+    print(f"snapshots build     {row_count:>9,} rows  {time.perf_counter() - start:9.2f} s")
+
+    def rescan(as_of_date):
+        balances = defaultdict(int)
+        for row in store.get_rows():
+            if row.date <= as_of_date:
+                amount = parse_cents(row.amount)
+                balances[row.debit] += amount
+                balances[row.credit] -= amount
+        return balances
+
+    results = []
+    for as_of_date in dates:
+        snapshot = _best_of(lambda: snapshots.balances_as_of(as_of_date), repeat)
+        scanned = _best_of(lambda: rescan(as_of_date), 1)
+        assert {k: v for k, v in snapshots.balances_as_of(as_of_date).items() if v} == \
+            {k: v for k, v in rescan(as_of_date).items() if v}
+        results.append((as_of_date, snapshot, scanned))
+        print(f"balances as of {as_of_date}  snapshot {snapshot * 1000:9.2f} ms  "
+              f"rescan {scanned * 1000:9.1f} ms")
+    return results
+
+
+def benchmark_account_ledger(row_count=1_000_000, repeat=3):
+    """Time one account's ledger from the per-account index against filtering every entry."""
+    store = TransactionStore.from_rows(make_rows(row_count) + [
+        TransactionRow("2025-12-31", "Rare posting", "Notes Payable [LIABILITY]", "Rare Account", "10.00"),
+    ])
+    ledger = GeneralLedger(store=store)
+
+    results = []
+    for account_name in ("Cash [ASSET]", "Rare Account"):
+        indexed = _best_of(lambda: ledger.get_account_ledger(account_name), repeat)
+        scanned = _best_of(lambda: [
+            entry for entry in ledger.ledger_entries
+            if account_name in (entry.debit, entry.credit)
+        ], repeat)
+        postings = len(ledger.get_account_ledger(account_name))
+        results.append((account_name, postings, indexed, scanned))
+        print(f"account ledger {account_name!r:<16} {postings:>9,} postings  index {indexed * 1000:9.2f} ms  "
+              f"filter {scanned * 1000:9.1f} ms")
+    return results
+
+
+def benchmark_refresh(row_count=1_000_000, appended=1_000, repeat=3):
+    """Time a Refresh when transactions.csv is unchanged or only appended to, against a full reload."""
+    import csv
+    import os
+    import tempfile
+    from storage_backends import CsvBackend, write_csv_rows
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "transactions.csv")
+        write_csv_rows(path, make_rows(row_count))
+        store = TransactionStore(CsvBackend(path))
+        store.load()
+
+        unchanged = _best_of(store.refresh, repeat)
+        reload = _best_of(store.reload, 1)
+
+        with open(path, mode="a", newline="", encoding="utf-8") as file:
+            csv.writer(file).writerows(row.values() for row in make_rows(appended, seed=3))
+        start = time.perf_counter()
+        kind = store.refresh()
+        grown = time.perf_counter() - start
+        assert kind == "appended" and len(store) == row_count + appended
+
+    print(f"refresh unchanged   {row_count:>9,} rows  {unchanged * 1000:9.2f} ms")
+    print(f"refresh +{appended:,} rows  {row_count:>9,} rows  {grown * 1000:9.2f} ms")
+    print(f"full reload         {row_count:>9,} rows  {reload * 1000:9.1f} ms")
+    return unchanged, grown, reload
+
+
+def benchmark_streaming(row_count=500_000, account=ACCOUNTS[0]):
+    """Compare peak memory and time of an account total streamed from disk against loading every row."""
+    import os
+    import tempfile
+    import tracemalloc
+    from money import parse_cents
+    from records import TransactionFilter
+    from storage_backends import CsvBackend, read_csv_rows, write_csv_rows
+
+    def streamed():
+        store = TransactionStore(CsvBackend(path))
+        count = total = 0
+        for record in store.iter_transactions(TransactionFilter(account=account)):
+            count += 1
+            total += record.amount
+        return count, total
+
+    def loaded():
+        amounts = [parse_cents(row.amount) for row in read_csv_rows(path) if account in (row.debit, row.credit)]
+        return len(amounts), sum(amounts)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "transactions.csv")
+        write_csv_rows(path, make_rows(row_count))
+        for label, func in (("stream", streamed), ("load all", loaded)):
+            tracemalloc.start()
+            start = time.perf_counter()
+            total = func()
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results[label] = (total, elapsed, peak)
+            print(f"{label:<9} {row_count:>9,} rows  {elapsed * 1000:9.1f} ms  peak {peak / 2**20:8.1f} MiB")
+    matched = results["stream"][0][0]
+    # An account name that matches nothing would make the comparison meaningless
+    assert matched > 0, f"no transactions use {account!r}"
+    assert results["stream"][0] == results["load all"][0]
+    print(f"{matched:,} transactions use {account}")
+    return results
+
+
+def benchmark_row_memory(row_count=200_000):
+    """Bytes per row of the dict layouts the views used to keep, against the slotted records.
+
+    The records are built as the views build them, with chart-of-accounts
+    IDs (taken from the rows) in place of account names.
+    """
+    import csv
+    import os
+    import tempfile
+    import tracemalloc
+    from money import parse_cents
+    from records import JournalLine, LedgerEntry
+    from storage_backends import read_csv_rows, write_csv_rows
+
+    def footprint(build):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        used = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        del kept
+        return used / row_count
+
+    def dict_rows():
+        with open(path, mode="r", newline="", encoding="utf-8") as file:
+            return [dict(row) for row in csv.DictReader(file)]
+
+    def dict_journal():
+        return [
+            line for row in rows for line in (
+                {"Date": row.date, "Description": row.description, "Account": row.debit,
+                 "Debit": row.amount, "Credit": ""},
+                {"Date": "", "Description": "", "Account": row.credit, "Debit": "", "Credit": row.amount},
+            )
+        ]
+
+    def record_journal():
+        return [
+            line for row in rows for line in (
+                JournalLine(row.date, row.description, row.debit_id, row.amount, ""),
+                JournalLine("", "", row.credit_id, "", row.amount),
+            )
+        ]
+
+    def dict_ledger():
+        return [
+            {"Date": row.date, "Description": row.description, "Debit": row.debit, "Credit": row.credit,
+             "Amount": parse_cents(row.amount), "Balance": 10 ** 12 + index}
+            for index, row in enumerate(rows)
+        ]
+
+    def record_ledger():
+        return [
+            LedgerEntry(row.date, row.description, row.debit_id, row.credit_id, parse_cents(row.amount),
+                        10 ** 12 + index)
+            for index, row in enumerate(rows)
+        ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "transactions.csv")
+        write_csv_rows(path, make_rows(row_count))
+        rows = read_csv_rows(path)
+        results = [
+            ("transactions", footprint(dict_rows), footprint(lambda: read_csv_rows(path))),
+            ("journal lines", footprint(dict_journal), footprint(record_journal)),
+            ("ledger entries", footprint(dict_ledger), footprint(record_ledger)),
+        ]
+    for label, before, after in results:
+        print(f"{label:<15} {row_count:>9,} rows  dicts {before:7.0f} B/row  records {after:7.0f} B/row")
+    return results
+
+
+def benchmark_bulk_import(row_count=200_000, single_posts=2_000):
+    """Rows per second of the bulk importer against posting one transaction at a time."""
+    import os
+    import tempfile
+    from bulk_import import import_transactions
+    from storage_backends import CsvBackend, write_csv_rows
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "bank_export.csv")
+        write_csv_rows(source, make_rows(row_count))
+
+        store = TransactionStore(CsvBackend(os.path.join(directory, "bulk.csv")))
+        start = time.perf_counter()
+        report = import_transactions(source, store=store)
+        bulk = time.perf_counter() - start
+        assert report.imported == row_count == len(store)
+
+        store = TransactionStore(CsvBackend(os.path.join(directory, "single.csv")))
+        write_csv_rows(store.backend.filename, [])
+        rows = make_rows(single_posts, seed=5)
+        start = time.perf_counter()
+        for row in rows:
+            store.add(row)
+        single = time.perf_counter() - start
+
+    print(f"bulk import         {row_count:>9,} rows  {bulk:9.2f} s  {row_count / bulk:12,.0f} rows/s")
+    print(f"one add() per row   {single_posts:>9,} rows  {single:9.2f} s  {single_posts / single:12,.0f} rows/s")
+    return bulk, single
+
+
+def benchmark_parallel_load(row_count=1_000_000, workers=(1, 2, 4)):
+    """Seconds to load and to import a large CSV file with 1, 2 and 4 parsing processes."""
+    import os
+    import tempfile
+    from bulk_import import import_transactions
+    from storage_backends import CsvBackend, write_csv_rows
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "transactions.csv")
+        write_csv_rows(source, make_rows(row_count))
+        expected = None
+        for count in workers:
+            start = time.perf_counter()
+            _, rows = CsvBackend(source, workers=count).load()
+            load = time.perf_counter() - start
+            values = [row.values() for row in rows]
+            if expected is None:
+                expected = values
+            assert values == expected
+            del rows, values
+
+            store = TransactionStore(CsvBackend(os.path.join(directory, f"import_{count}.csv")))
+            start = time.perf_counter()
+            report = import_transactions(source, store=store, workers=count)
+            imported = time.perf_counter() - start
+            assert report.imported == row_count
+            results[count] = (load, imported)
+
+    for count, (load, imported) in results.items():
+        print(f"{count} worker(s)  {row_count:>9,} rows  load {load:7.2f} s  import {imported:7.2f} s")
+    return results
+
+
+def benchmark_trial_balance(row_count=1_000_000, repeat=3):
+    """Trial balance totals from the balance cache and from one posting scan, against summing the journal."""
+    from trial_balance import TrialBalance
+
+    store = TransactionStore.from_rows(make_rows(row_count))
+    journal = GeneralJournal(store)
+    trial_balance = TrialBalance(AccountsManager(store))
+
+    start = time.perf_counter()
+    lines = trial_balance.get_lines()
+    build = time.perf_counter() - start
+    assert not trial_balance.find_problems()
+    posting_totals = trial_balance.get_totals(trial_balance.get_lines(postings=True))
+    assert tuple(posting_totals) == journal.get_totals()
+
+    timings = [
+        ("journal get_totals", _best_of(journal.get_totals, repeat)),
+        ("first trial balance", build),
+        ("cached trial balance", _best_of(lambda: trial_balance.get_totals(trial_balance.get_lines()), repeat)),
+        ("posting totals scan", _best_of(lambda: trial_balance.get_lines(postings=True), repeat)),
+        ("problem check", _best_of(trial_balance.find_problems, repeat)),
+    ]
+    store.add(make_rows(1, seed=9)[0])
+    assert not trial_balance.find_problems()
+    for label, seconds in timings:
+        print(f"{label:<22} {row_count:>9,} rows  {seconds * 1000:10.2f} ms")
+    return timings
+
+
+# Modules shared by the GUI and the headless tools; none of them may load a GUI toolkit
+CORE_MODULES = ("money", "chart_of_accounts", "records", "transaction_store", "accounts_manager",
+                "general_journal", "general_ledger", "trial_balance", "bulk_import", "reports")
+GUI_MODULES = ("tkinter", "tkcalendar")
+
+
+def import_time(module, repeat=3):
+    """Best-of-`repeat` cumulative `python -X importtime` cost of `module` in a fresh interpreter.
+
+    Returns (milliseconds, GUI modules it loaded); milliseconds is None if
+    importtime reported no line for the module.
+    """
+    import os
+    import subprocess
+    import sys
+
+    base = os.path.dirname(os.path.abspath(__file__))
+    code = f"import sys, {module}; print(','.join(sorted(set({GUI_MODULES!r}) & set(sys.modules))))"
+    best = None
+    loaded = []
+    for _ in range(repeat):
+        done = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=base,
+                              capture_output=True, text=True, check=True)
+        loaded = [name for name in done.stdout.strip().split(",") if name]
+        # Lines read "import time: self [us] | cumulative | name"; the module's own line has its total
+        for line in done.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == module:
+                micros = int(fields[1])
+                best = micros if best is None else min(best, micros)
+    return (best / 1000 if best is not None else None), loaded
+
+
+def benchmark_import_time(modules=CORE_MODULES, budget_ms=60, repeat=3):
+    """Import cost of each core module against a budget (tests/test_import_time.py enforces it).
+
+    Each module is imported in a fresh interpreter (best of `repeat`).
+    Modules that load tkinter or tkcalendar, or take longer than
+    `budget_ms` milliseconds, are marked with ❌.
+    """
+    results = {}
+    for module in modules:
+        milliseconds, loaded = import_time(module, repeat)
+        results[module] = milliseconds
+        if milliseconds is None:
+            print(f"import {module:<20}       ? ms  ❌ no importtime line for the module")
+            continue
+        problems = []
+        if milliseconds > budget_ms:
+            problems.append(f"over the {budget_ms} ms budget")
+        if loaded:
+            problems.append(f"imports {', '.join(loaded)}")
+        print(f"import {module:<20} {milliseconds:7.1f} ms" + (f"  ❌ {'; '.join(problems)}" if problems else ""))
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_accounts_summary()
+    benchmark_posting()
+    benchmark_search()
+    benchmark_columnar_load()
+    benchmark_money()
+    benchmark_vectorized_balances()
+    benchmark_journal_date_range()
+    benchmark_balance_as_of()
+    benchmark_account_ledger()
+    benchmark_refresh()
+    benchmark_streaming()
+    benchmark_row_memory()
+    benchmark_bulk_import()
+    benchmark_parallel_load()
+    benchmark_trial_balance()
+    benchmark_import_time()
@@ -0,0 +1,250 @@
+"""Bulk import of transactions from CSV, JSON or JSON Lines files.
+
+Usage, from the base directory:
+
+    python bulk_import.py bank_export.csv [--errors rejected.csv]
+
+Records need the transactions.csv fields (Date, Description, Debit,
+Credit, Amount). The input is read as a stream and validated a batch at a
+time; every valid row of a batch is written with one buffered append, so a
+month of bank exports costs one open/write cycle instead of one per row.
+Rejected records go to an error report with their line number and reason.
+CSV files of PARALLEL_MIN_BYTES or more are validated by a process pool,
+one record-aligned byte range per task, and written back in file order.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from itertools import islice, starmap
+from typing import NamedTuple, Optional
+
+from money import cents_to_str, parse_cents
+from parallel_csv import (CHUNKS_PER_WORKER, PARALLEL_MIN_BYTES, default_workers, map_chunks, read_header,
+                          read_records, record_chunks)
+from records import TransactionRow, iso_date
+from transaction_store import REQUIRED_FIELDS, get_store
+
+BATCH_SIZE = 50_000
+FORMATS = {".csv": "csv", ".json": "json", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+ERROR_FIELDS = ["Line", "Error"] + REQUIRED_FIELDS
+
+
+class ImportReport(NamedTuple):
+    """What an import did: rows written, records rejected and where they were reported."""
+    imported: int
+    rejected: int
+    error_path: Optional[str]
+
+
+def _check_fields(date, description, debit, credit, amount):
+    """Return the five field strings as they will be stored, or raise ValueError."""
+    if not (date and description and debit and credit and amount):
+        raise ValueError("All fields are required")
+    date = iso_date(date)
+    if date is None:
+        raise ValueError("Date must be in YYYY-MM-DD format")
+    try:
+        cents = parse_cents(amount)
+    except ValueError:
+        raise ValueError("Amount must be a valid number")
+    return date, description, debit, credit, cents_to_str(cents)
+
+
+def _validate(date, description, debit, credit, amount):
+    """Build a TransactionRow from five field strings, or raise ValueError."""
+    return TransactionRow(*_check_fields(date, description, debit, credit, amount))
+
+
+def validate_record(record):
+    """Turn one input record into a TransactionRow, or raise ValueError saying why not.
+
+    The rules are add_transaction's: every field is required, the date is
+    YYYY-MM-DD (stored zero padded) and the amount a number (stored with
+    two decimals).
+    """
+    if not isinstance(record, dict):
+        raise ValueError("Record is not an object")
+    try:
+        values = [record[field] for field in REQUIRED_FIELDS]
+    except KeyError as e:
+        raise ValueError(f"Missing field {e}")
+    # JSON numbers and nulls become text, as they would in a CSV export
+    return _validate(*["" if value is None else str(value) for value in values])
+
+
+def _csv_columns(header):
+    missing = [field for field in REQUIRED_FIELDS if field not in header]
+    if missing:
+        raise ValueError(f"CSV header is missing {', '.join(missing)}")
+    return [header.index(field) for field in REQUIRED_FIELDS]
+
+
+def _validate_range(task):
+    """Process-pool worker: check the CSV records in one byte range.
+
+    Returns (lines read, valid field tuples, rejected records); line
+    numbers are relative to the start of the range.
+    """
+    path, start, stop, columns = task
+    width = max(columns)
+    valid, rejected = [], []
+    lines = 0
+    for lines, record in read_records(path, start, stop):
+        if not record:
+            continue
+        if len(record) <= width:
+            record += [""] * (width + 1 - len(record))
+        fields = [record[column] for column in columns]
+        try:
+            valid.append(_check_fields(*fields))
+        except ValueError as e:
+            rejected.append((lines, str(e), fields))
+    return lines, valid, rejected
+
+
+def _read_records(file, file_format):
+    """Yield (line number, fields) pairs from an open input file.
+
+    `fields` is a list of the five field strings, a dict for JSON records
+    (checked by validate_record) or a ValueError for an unreadable record.
+    """
+    if file_format == "csv":
+        # csv.reader plus column positions: a DictReader costs a dict per line
+        reader = csv.reader(file)
+        columns = _csv_columns(next(reader, None) or [])
+        width = max(columns)
+        for record in reader:
+            if not record:
+                continue
+            if len(record) <= width:
+                # Short lines are padded, so they are rejected with what they did have
+                record += [""] * (width + 1 - len(record))
+            yield reader.line_num, [record[column] for column in columns]
+    elif file_format == "jsonl":
+        for number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield number, json.loads(line)
+            except ValueError as e:
+                yield number, ValueError(f"Invalid JSON: {e}")
+    else:
+        # A JSON document has to be parsed whole: an array of records, or {"transactions": [...]}
+        data = json.load(file)
+        if isinstance(data, dict):
+            data = data.get("transactions", [])
+        if not isinstance(data, list):
+            raise ValueError("JSON input must be an array of records or {\"transactions\": [...]}")
+        for number, record in enumerate(data, start=1):
+            yield number, record
+
+
+def _write_errors(error_path, errors):
+    with open(error_path, mode="w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(ERROR_FIELDS)
+        for number, message, record in errors:
+            if isinstance(record, dict):
+                record = [record.get(field, "") for field in REQUIRED_FIELDS]
+            elif not isinstance(record, list):
+                record = [""] * len(REQUIRED_FIELDS)
+            writer.writerow([number, message] + record)
+
+
+def _import_serial(path, file_format, store, batch_size):
+    imported = 0
+    errors = []
+    with open(path, mode="r", newline="", encoding="utf-8-sig") as file:
+        records = _read_records(file, file_format)
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+            rows = []
+            for number, record in batch:
+                try:
+                    if isinstance(record, ValueError):
+                        raise record
+                    # Only CSV lines arrive as field lists; a JSON array is not a record
+                    if file_format == "csv":
+                        rows.append(_validate(*record))
+                    else:
+                        rows.append(validate_record(record))
+                except ValueError as e:
+                    errors.append((number, str(e), record))
+            imported += len(store.add_many(rows))
+    return imported, errors
+
+
+def _import_parallel(path, store, workers):
+    header, start = read_header(path, encoding="utf-8-sig")
+    columns = _csv_columns(header)
+    chunks = record_chunks(path, start, os.path.getsize(path), workers * CHUNKS_PER_WORKER)
+    tasks = [(path, chunk_start, chunk_stop, columns) for chunk_start, chunk_stop in chunks]
+
+    imported = 0
+    errors = []
+    line = 1
+    # Results arrive in file order; each range is one batch for add_many()
+    for lines, valid, rejected in map_chunks(_validate_range, tasks, workers):
+        imported += len(store.add_many(list(starmap(TransactionRow, valid))))
+        errors.extend((line + number, message, fields) for number, message, fields in rejected)
+        line += lines
+    return imported, errors
+
+
+def import_transactions(path, file_format=None, error_path=None, batch_size=BATCH_SIZE, store=None, workers=None):
+    """Import every valid record of `path` into the store (default: the shared store).
+
+    `file_format` is "csv", "json" or "jsonl" (default: from the file
+    extension). Rejected records are written to `error_path` (default: the
+    input name with ".errors.csv"); the file is only created when something
+    was rejected. Large CSV files are validated by `workers` processes
+    (default: one per CPU). Returns an ImportReport.
+    """
+    store = store if store is not None else get_store()
+    if file_format is None:
+        file_format = FORMATS.get(os.path.splitext(path)[1].lower())
+        if file_format is None:
+            raise ValueError(f"Cannot tell the format of {path}; use csv, json or jsonl")
+    if error_path is None:
+        error_path = os.path.splitext(path)[0] + ".errors.csv"
+    workers = workers if workers is not None else default_workers()
+
+    if file_format == "csv" and workers > 1 and os.path.getsize(path) >= PARALLEL_MIN_BYTES:
+        imported, errors = _import_parallel(path, store, workers)
+    else:
+        imported, errors = _import_serial(path, file_format, store, batch_size)
+
+    if errors:
+        _write_errors(error_path, errors)
+        print(f"❌ Rejected {len(errors)} records, see {error_path}")
+    print(f"✅ Imported {imported} transactions from {path}")
+    return ImportReport(imported, len(errors), error_path if errors else None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import transactions from a CSV, JSON or JSON Lines file.")
+    parser.add_argument("path", help="file to import")
+    parser.add_argument("--format", choices=sorted(set(FORMATS.values())), help="input format (default: from the extension)")
+    parser.add_argument("--errors", help="where to write rejected records (default: <input>.errors.csv)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="records validated and written per append")
+    parser.add_argument("--workers", type=int, help="processes for large CSV files (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        report = import_transactions(args.path, args.format, args.errors, args.batch_size, workers=args.workers)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error importing transactions: {str(e)}")
+        return 1
+    elapsed = time.perf_counter() - start
+    print(f"{report.imported + report.rejected} records in {elapsed:.2f} s")
+    return 0 if not report.rejected else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+import threading
+
+# The standard accounts and their types; other names get an ID with no type
+ACCOUNT_TYPES = {
+    # ASSETS
+    "Cash [ASSET]": "Assets",
+    "Accounts Receivable [ASSET]": "Assets",
+    "Inventory [ASSET]": "Assets",
+    "Prepaid Expenses [ASSET]": "Assets",
+    "Equipment [ASSET]": "Assets",
+
+    # LIABILITIES
+    "Accounts Payable [LIABILITY]": "Liabilities",
+    "Notes Payable [LIABILITY]": "Liabilities",
+
+    # EQUITY
+    "Owner's Capital [EQUITY]": "Equities",
+
+    # INCOME
+    "Sales Revenue [INCOME]": "Income",
+    "Service Revenue [INCOME]": "Income",
+
+    # EXPENSES
+    "Cost of Goods Sold [EXPENSE]": "Expenses",
+    "Rent Expense [EXPENSE]": "Expenses",
+    "Salaries Expense [EXPENSE]": "Expenses",
+    "Utilities Expense [EXPENSE]": "Expenses"
+}
+
+
+# Listahan sa mga account, matag usa naay gamay nga numero (Bisaya)
+class ChartOfAccounts:
+    """Registry that gives every account name a small integer ID.
+
+    The standard accounts come first, in ACCOUNT_TYPES order; any other
+    name gets the next ID the first time it is seen. IDs never change while
+    the process runs, so rows store the ID and names are looked up only
+    when something is displayed. ``types[account_id]`` is the account's
+    type (None for accounts outside the standard chart), which lets
+    roll-ups group by list position instead of by name.
+    """
+
+    def __init__(self, account_types=ACCOUNT_TYPES):
+        self.names = []
+        self.types = []
+        self.ids = {}
+        self._lock = threading.Lock()
+        for name, account_type in account_types.items():
+            self.types.append(account_type)
+            self.ids[name] = len(self.names)
+            self.names.append(name)
+
+    def id_of(self, name):
+        """Return the ID of `name`, registering it if it is new."""
+        account_id = self.ids.get(name)
+        if account_id is None:
+            with self._lock:
+                account_id = self.ids.get(name)
+                if account_id is None:
+                    account_id = len(self.names)
+                    # Lists first, so an ID is never handed out before its name is readable
+                    self.names.append(name)
+                    self.types.append(None)
+                    self.ids[name] = account_id
+        return account_id
+
+    def find(self, name):
+        """Return the ID of `name`, or None if no row has used it."""
+        return self.ids.get(name)
+
+    def name_of(self, account_id):
+        return self.names[account_id]
+
+    def type_of(self, account_id):
+        return self.types[account_id]
+
+    def __len__(self):
+        return len(self.names)
+
+
+_chart = ChartOfAccounts()
+
+
+def get_chart_of_accounts():
+    """Return the chart of accounts shared by the whole process."""
+    return _chart
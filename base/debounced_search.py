@@ -0,0 +1,94 @@
+import queue
+import threading
+
+
+# Maghulat nga mohunong ang pag-type una mangita, sa laing thread (Bisaya)
+class DebouncedSearch:
+    """Search-as-you-type that keeps the filtering off the Tk main thread.
+
+    ``schedule(term)`` waits until typing pauses for ``delay_ms`` before it
+    starts a query. Every call bumps a generation number, so a query that a
+    newer keystroke has replaced is skipped if it has not started yet, and
+    its results are dropped if it has. ``query(term)`` runs on a worker
+    thread; ``render(results)`` and ``on_error(exc)`` run on the Tk thread,
+    picked up from a queue with ``after()`` polling.
+    """
+
+    def __init__(self, widget, query, render, on_error=None, delay_ms=250, poll_ms=20):
+        self.widget = widget
+        self.query = query
+        self.render = render
+        self.on_error = on_error
+        self.delay_ms = delay_ms
+        self.poll_ms = poll_ms
+
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._pending_after = None
+        self._polling = False
+        self._outstanding = 0
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._worker = threading.Thread(target=self._work, daemon=True)
+        self._worker.start()
+
+    def _is_current(self, generation):
+        with self._lock:
+            return generation == self._generation
+
+    def cancel(self):
+        """Drop the pending and the running query, if any."""
+        with self._lock:
+            self._generation += 1
+        if self._pending_after is not None:
+            self.widget.after_cancel(self._pending_after)
+            self._pending_after = None
+
+    def schedule(self, term):
+        """Search for `term` once typing has paused."""
+        self.cancel()
+        with self._lock:
+            generation = self._generation
+        self._pending_after = self.widget.after(self.delay_ms, self._start, generation, term)
+
+    def _start(self, generation, term):
+        self._pending_after = None
+        if not self._is_current(generation):
+            return
+        self._outstanding += 1
+        self._jobs.put((generation, term))
+        if not self._polling:
+            self._polling = True
+            self.widget.after(self.poll_ms, self._poll)
+
+    def _work(self):
+        while True:
+            generation, term = self._jobs.get()
+            # A newer keystroke already replaced this query
+            if not self._is_current(generation):
+                self._results.put((generation, None, None, True))
+                continue
+            try:
+                self._results.put((generation, self.query(term), None, False))
+            except Exception as e:
+                self._results.put((generation, None, e, False))
+
+    def _poll(self):
+        while True:
+            try:
+                generation, results, error, skipped = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+            if skipped or not self._is_current(generation):
+                continue
+            if error is not None:
+                if self.on_error:
+                    self.on_error(error)
+            else:
+                self.render(results)
+
+        if self._outstanding > 0:
+            self.widget.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
@@ -0,0 +1,74 @@
+import hashlib
+import os
+
+TAIL_SIZE = 4096
+
+
+# Nagbantay kung nausab ba ang file, o nadugangan ra sa tumoy (Bisaya)
+class FileWatcher:
+    """Tell whether a file changed since it was last read, and how.
+
+    ``mark(size)`` records the file's modification time, the number of
+    bytes that were read and a hash of the last ``tail_size`` of those
+    bytes. ``check()`` then compares the file against that record:
+
+    * ``"unchanged"`` - same size, same mtime and the same tail;
+    * ``"appended"`` - the file only grew: the bytes that were read still
+      end with the same tail, at the same offset, on a line boundary;
+    * ``"changed"`` - anything else, including a file that was never read.
+
+    Only the tail is hashed, so a check costs one stat and one small read
+    whatever the size of the file.
+    """
+
+    def __init__(self, path, tail_size=TAIL_SIZE):
+        self.path = path
+        self.tail_size = tail_size
+        self.reset()
+
+    def reset(self):
+        """Forget the record, so the next check reports a change."""
+        self.size = None
+        self.mtime_ns = None
+        self.tail_hash = None
+        self.ends_with_newline = False
+
+    def _tail(self, file, end):
+        start = max(0, end - self.tail_size)
+        file.seek(start)
+        data = file.read(end - start)
+        return hashlib.blake2b(data, digest_size=16).digest(), end == 0 or data.endswith(b"\n")
+
+    def mark(self, size=None):
+        """Record the file as read up to `size` bytes (default: all of it)."""
+        try:
+            stat = os.stat(self.path)
+            size = stat.st_size if size is None else size
+            with open(self.path, mode="rb") as file:
+                self.tail_hash, self.ends_with_newline = self._tail(file, size)
+            self.size = size
+            self.mtime_ns = stat.st_mtime_ns
+        except OSError:
+            self.reset()
+
+    def check(self):
+        """Return ("unchanged" | "appended" | "changed", offset of the unread bytes)."""
+        if self.size is None:
+            return "changed", 0
+        try:
+            stat = os.stat(self.path)
+            if stat.st_size < self.size:
+                return "changed", 0
+            with open(self.path, mode="rb") as file:
+                tail_hash, _ = self._tail(file, self.size)
+        except OSError:
+            return "changed", 0
+
+        if tail_hash != self.tail_hash:
+            return "changed", 0
+        if stat.st_size == self.size:
+            # Same length and tail but a new mtime can still be an edit in the middle
+            return ("unchanged", self.size) if stat.st_mtime_ns == self.mtime_ns else ("changed", 0)
+        if not self.ends_with_newline:
+            return "changed", 0
+        return "appended", self.size
@@ -1,48 +1,97 @@
-import csv
-import os
+from bisect import bisect_left, bisect_right, insort
 from datetime import datetime
+from money import parse_cents
+from records import JournalLine
+from transaction_store import get_store
+from search_index import get_search_index
+
+SEARCH_FIELDS = ("Date", "Description", "Debit", "Credit")
+DATE_FORMAT = '%Y-%m-%d'
+
+
+def _parse_date(text, cache=None):
+    """Parse a YYYY-MM-DD date, or return None if it is not one."""
+    if cache is not None and text in cache:
+        return cache[text]
+    try:
+        parsed = datetime.strptime(text, DATE_FORMAT).date()
+    except (TypeError, ValueError):
+        parsed = None
+    if cache is not None:
+        cache[text] = parsed
+    return parsed
 
 class GeneralJournal:
-    def __init__(self):
+    def __init__(self, store=None):
+        self.store = store if store is not None else get_store()
+        self.search_index = get_search_index(self.store)
         self.journal_entries = []
+        self._entries_by_key = {}
+        # Keys of the dated transactions by date, and the distinct dates kept sorted for range lookups.
+        # There are far fewer dates than transactions, so a posting inserts into a short list.
+        self._keys_by_date = {}
+        self._dates = []
         self.load_journal_entries()
+        self.store.subscribe(self._on_store_change)
     
     def load_journal_entries(self):
-        """Load journal entries from transactions.csv"""
+        """Build journal entries from the shared transaction store"""
         self.journal_entries = []
+        self._entries_by_key = {}
+        self._keys_by_date = {}
+        self._dates = []
         
         try:
-            # Check parent directory first, then current directory for transactions.csv
-            csv_file = "../transactions.csv"
-            if not os.path.exists(csv_file):
-                csv_file = "transactions.csv"
-                if not os.path.exists(csv_file):
-                    return
-                
-            with open(csv_file, mode="r", newline="", encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if all(key in row for key in ["Date", "Description", "Debit", "Credit", "Amount"]):
-                        # Create two journal entries for each transaction (debit and credit)
-                        self.journal_entries.append({
-                            "Date": row["Date"],
-                            "Description": row["Description"],
-                            "Account": row["Debit"],
-                            "Debit": row["Amount"],
-                            "Credit": ""
-                        })
-                        
-                        self.journal_entries.append({
-                            "Date": "",
-                            "Description": "",
-                            "Account": row["Credit"],
-                            "Debit": "",
-                            "Credit": row["Amount"]
-                        })
+            # Dates repeat a lot, so each distinct one is parsed only once
+            parsed_dates = {}
+            for key, row in self.store.get_items():
+                entries = self._entries_for(row)
+                self._entries_by_key[key] = entries
+                self.journal_entries.extend(entries)
+                entry_date = _parse_date(row.date, parsed_dates)
+                if entry_date is not None:
+                    self._keys_by_date.setdefault(entry_date, []).append(key)
+            self._dates = sorted(self._keys_by_date)
                         
         except Exception as e:
             print(f"Error loading journal entries: {e}")
     
+    def _entries_for(self, row):
+        """Create two journal entries for a transaction (debit and credit)"""
+        return (
+            JournalLine(row.date, row.description, row.debit_id, row.amount, ""),
+            JournalLine("", "", row.credit_id, "", row.amount),
+        )
+    
+    def _on_store_change(self, event, row, index, key):
+        """Add or drop the two lines of a posted or deleted transaction"""
+        if event == "add":
+            entries = self._entries_for(row)
+            self._entries_by_key[key] = entries
+            self.journal_entries.extend(entries)
+            entry_date = _parse_date(row.date)
+            if entry_date is not None:
+                keys = self._keys_by_date.get(entry_date)
+                if keys is None:
+                    keys = self._keys_by_date[entry_date] = []
+                    insort(self._dates, entry_date)
+                # Keys only grow, so appending keeps each date's list sorted
+                keys.append(key)
+        elif event == "remove":
+            self._entries_by_key.pop(key, None)
+            del self.journal_entries[2 * index:2 * index + 2]
+            entry_date = _parse_date(row.date)
+            keys = self._keys_by_date.get(entry_date)
+            if keys:
+                position = bisect_left(keys, key)
+                if position < len(keys) and keys[position] == key:
+                    del keys[position]
+                if not keys:
+                    del self._keys_by_date[entry_date]
+                    del self._dates[bisect_left(self._dates, entry_date)]
+        else:
+            self.load_journal_entries()
+    
     def get_all_journal_entries(self):
         """Return all journal entries"""
         return self.journal_entries
@@ -52,77 +101,51 @@ class GeneralJournal:
         if not search_term:
             return self.journal_entries
             
-        search_lower = search_term.lower()
+        # Each matching transaction contributes both its debit and credit entry
         filtered_entries = []
-        
-        # Process entries in pairs (each transaction has 2 entries)
-        i = 0
-        while i < len(self.journal_entries):
-            entry1 = self.journal_entries[i]
-            
-            # Check if this is a complete transaction pair (first entry has date and description)
-            if entry1["Date"] and entry1["Description"]:
-                # Get the second entry (next entry should be the credit side)
-                entry2 = self.journal_entries[i + 1] if i + 1 < len(self.journal_entries) else None
-                
-                # Check if any entry in this transaction matches the search
-                transaction_matches = False
-                if (search_lower in entry1["Date"].lower() or 
-                    search_lower in entry1["Description"].lower() or 
-                    search_lower in entry1["Account"].lower()):
-                    transaction_matches = True
-                elif entry2 and search_lower in entry2["Account"].lower():
-                    transaction_matches = True
-                
-                # If transaction matches, add both entries
-                if transaction_matches:
-                    filtered_entries.append(entry1)
-                    if entry2:
-                        filtered_entries.append(entry2)
-                
-                # Move to next transaction pair
-                i += 2
-            else:
-                # Skip entries without proper transaction structure
-                i += 1
+        keys = self.search_index.search_keys(search_term, SEARCH_FIELDS)
+        with self.store.lock:
+            for key in keys:
+                entries = self._entries_by_key.get(key)
+                if entries:
+                    filtered_entries.extend(entries)
                 
         return filtered_entries
     
     def get_journal_entries_by_date_range(self, start_date, end_date):
-        """Get journal entries within a specific date range"""
+        """Get journal entries within a specific date range, as debit/credit pairs in date order"""
         try:
-            start = datetime.strptime(start_date, '%Y-%m-%d')
-            end = datetime.strptime(end_date, '%Y-%m-%d')
-            
-            filtered_entries = []
-            for entry in self.journal_entries:
-                if entry["Date"]:
-                    entry_date = datetime.strptime(entry["Date"], '%Y-%m-%d')
-                    if start <= entry_date <= end:
-                        filtered_entries.append(entry)
-                        
-            return filtered_entries
-            
+            start = datetime.strptime(start_date, DATE_FORMAT).date()
+            end = datetime.strptime(end_date, DATE_FORMAT).date()
         except ValueError:
             return []
+        
+        # Two binary searches on the sorted dates, then copy out each date's transactions
+        filtered_entries = []
+        with self.store.lock:
+            dates = self._dates
+            for entry_date in dates[bisect_left(dates, start):bisect_right(dates, end)]:
+                for key in self._keys_by_date[entry_date]:
+                    filtered_entries.extend(self._entries_by_key[key])
+        return filtered_entries
     
     def get_totals(self, entries=None):
-        """Calculate total debits and credits for given entries"""
+        """Calculate total debits and credits for given entries, in integer cents"""
         if entries is None:
             entries = self.journal_entries
             
-        total_debits = 0.0
-        total_credits = 0.0
+        total_debits = 0
+        total_credits = 0
     
         for entry in entries:
-            if entry["Debit"]:
+            if entry.debit:
                 try:
-                    total_debits += float(entry["Debit"])
+                    total_debits += parse_cents(entry.debit)
                 except ValueError:
                     pass
-            if entry["Credit"]:
+            if entry.credit:
                 try:
-                    total_credits += float(entry["Credit"])
+                    total_credits += parse_cents(entry.credit)
                 except ValueError:
                     pass
                     
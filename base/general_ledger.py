@@ -1,88 +1,187 @@
-import csv
-import os
+from bisect import bisect_left
+from collections import defaultdict
+from chart_of_accounts import get_chart_of_accounts
+from money import parse_cents
+from records import LedgerEntry
+from transaction_store import get_store
+from search_index import get_search_index
+
+SEARCH_FIELDS = ("Date", "Description", "Debit", "Credit")
 
 
 # Klase para sa General Ledger data gikan sa CSV (Bisaya)
 class GeneralLedger:
-    """Simple general ledger loader backed by transactions.csv."""
-
-    REQUIRED_FIELDS = ["Date", "Description", "Debit", "Credit", "Amount"]
-
-    def __init__(self):
+    """Simple general ledger built from the shared transaction store.
+
+    Amount and Balance on each entry are integer cents. Besides the flat
+    list, every account maps to the keys of the transactions that post to
+    it, so one account's ledger (T-account view) is read without touching
+    the others. Accounts are indexed by chart-of-accounts ID.
+    A deletion only marks the running balances after it as stale; they are
+    recomputed in one pass when entries are next read, so deleting several
+    transactions costs one pass, not one per deletion.
+    `accounts_manager`, when given, supplies each account's normal balance
+    side.
+    """
+
+    def __init__(self, store=None, accounts_manager=None):
+        self.store = store if store is not None else get_store()
+        self.accounts_manager = accounts_manager
+        self.chart = get_chart_of_accounts()
+        self.search_index = get_search_index(self.store)
         self.ledger_entries = []
+        self._entry_by_key = {}
+        self._postings = defaultdict(list)
+        self.running_balance = 0
+        # Position of the first entry whose balance is out of date, or None
+        self._stale_from = None
         self.load_ledger_entries()
-
-    def _resolve_transactions_path(self):
-        """Return the first existing transactions.csv path."""
-        potential_paths = ["../transactions.csv", "transactions.csv"]
-        for path in potential_paths:
-            if os.path.exists(path):
-                return path
-        return None
+        self.store.subscribe(self._on_store_change)
 
     def load_ledger_entries(self):
         """Load transactions and compute a running balance."""
         self.ledger_entries = []
-        running_balance = 0.0
-
-        csv_path = self._resolve_transactions_path()
-        if not csv_path:
-            return
+        self._entry_by_key = {}
+        self._postings = defaultdict(list)
+        self._stale_from = None
+        running_balance = 0
 
         try:
-            with open(csv_path, mode="r", newline="", encoding="utf-8") as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if not all(field in row for field in self.REQUIRED_FIELDS):
-                        continue
-
-                    try:
-                        amount = float(row["Amount"])
-                    except (TypeError, ValueError):
-                        amount = 0.0
-
-                    running_balance += amount
-
-                    self.ledger_entries.append(
-                        {
-                            "Date": row["Date"],
-                            "Description": row["Description"],
-                            "Debit": row["Debit"],
-                            "Credit": row["Credit"],
-                            "Amount": amount,
-                            "Balance": running_balance,
-                        }
-                    )
+            for key, row in self.store.get_items():
+                entry = self._entry_for(row, running_balance)
+                running_balance = entry.balance
+                self._entry_by_key[key] = entry
+                self.ledger_entries.append(entry)
+                self._index_posting(key, row)
         except Exception as exc:
             print(f"Error loading ledger entries: {exc}")
+        self.running_balance = running_balance
 
-    def get_all_entries(self):
-        return self.ledger_entries
+    def _entry_for(self, row, running_balance):
+        try:
+            amount = parse_cents(row.amount)
+        except (TypeError, ValueError):
+            amount = 0
+
+        return LedgerEntry(row.date, row.description, row.debit_id, row.credit_id, amount, running_balance + amount)
+
+    def _index_posting(self, key, row):
+        # Keys only grow, so appending keeps every account's list sorted
+        self._postings[row.debit_id].append(key)
+        if row.credit_id != row.debit_id:
+            self._postings[row.credit_id].append(key)
+
+    def _unindex_posting(self, key, row):
+        for account_id in {row.debit_id, row.credit_id}:
+            keys = self._postings.get(account_id)
+            if not keys:
+                continue
+            position = bisect_left(keys, key)
+            if position < len(keys) and keys[position] == key:
+                del keys[position]
+            if not keys:
+                del self._postings[account_id]
+
+    def _on_store_change(self, event, row, index, key):
+        """Update entries and the running balance for one posted or deleted row."""
+        if event == "add":
+            entry = self._entry_for(row, self.running_balance)
+            self.running_balance = entry.balance
+            self._entry_by_key[key] = entry
+            self.ledger_entries.append(entry)
+            self._index_posting(key, row)
+        elif event == "remove":
+            self._entry_by_key.pop(key, None)
+            self._unindex_posting(key, row)
+            entry = self.ledger_entries.pop(index)
+            self.running_balance -= entry.amount
+            # Only the entries after the deleted one carry a different balance
+            if index < len(self.ledger_entries) and (self._stale_from is None or index < self._stale_from):
+                self._stale_from = index
+        else:
+            self.load_ledger_entries()
+
+    def _settle(self):
+        """Recompute the running balances from the first stale entry on; call with the store lock held."""
+        start = self._stale_from
+        if start is None:
+            return
+        entries = self.ledger_entries
+        balance = entries[start - 1].balance if start else 0
+        for entry in entries[start:]:
+            balance += entry.amount
+            entry.balance = balance
+        self._stale_from = None
 
-    def search_entries(self, search_term=""):
-        if not search_term:
+    def get_all_entries(self):
+        with self.store.lock:
+            self._settle()
             return self.ledger_entries
 
-        search_lower = search_term.lower()
-        filtered = []
-        for entry in self.ledger_entries:
-            if (
-                search_lower in entry["Date"].lower()
-                or search_lower in entry["Description"].lower()
-                or search_lower in entry["Debit"].lower()
-                or search_lower in entry["Credit"].lower()
-            ):
-                filtered.append(entry)
-        return filtered
+    def search_entries(self, search_term=""):
+        # Searched before taking the lock: a first search may have to build the index
+        keys = self.search_index.search_keys(search_term, SEARCH_FIELDS) if search_term else None
+        with self.store.lock:
+            self._settle()
+            if not search_term:
+                return self.ledger_entries
+            return [self._entry_by_key[key] for key in keys if key in self._entry_by_key]
+
+    def get_accounts(self):
+        """Names of the accounts that have postings, sorted."""
+        with self.store.lock:
+            return sorted(self.chart.names[account_id] for account_id in self._postings)
+
+    def get_account_ledger(self, account_name, search_term="", normal_balance=None):
+        """One account's postings with a running balance on its normal balance side.
+
+        Each LedgerEntry has `side` set ("Debit" or "Credit", the side this
+        account is on); `balance` grows with postings on the normal side and
+        shrinks with the others.
+        """
+        if normal_balance is None and self.accounts_manager is not None:
+            normal_balance = self.accounts_manager.get_normal_balance(account_name)
+        sign = -1 if normal_balance == "Credit" else 1
+        if search_term:
+            matches = set(self.search_index.search_keys(search_term, SEARCH_FIELDS))
+
+        with self.store.lock:
+            account_id = self.chart.find(account_name)
+            keys = self._postings.get(account_id, ())
+            balance = 0
+            entries = []
+            for key in keys:
+                entry = self._entry_by_key[key]
+                amount = entry.amount
+                change = 0
+                if entry.debit_id == account_id:
+                    change += amount
+                if entry.credit_id == account_id:
+                    change -= amount
+                balance += sign * change
+                if search_term and key not in matches:
+                    continue
+                side = "Debit" if entry.debit_id == account_id else "Credit"
+                entries.append(LedgerEntry(entry.date, entry.description, entry.debit_id, entry.credit_id,
+                                           amount, balance, side))
+        return entries
+
+    def get_account_totals(self, entries):
+        """Debit postings, credit postings and closing balance of an account ledger."""
+        total_debits = sum(entry.amount for entry in entries if entry.side == "Debit")
+        total_credits = sum(entry.amount for entry in entries if entry.side == "Credit")
+        balance = entries[-1].balance if entries else 0
+        return total_debits, total_credits, balance
 
     def get_totals(self, entries=None):
-        entries = entries or self.ledger_entries
-        total_amount = 0.0
-        last_balance = 0.0
+        if not entries:
+            entries = self.get_all_entries()
+        total_amount = 0
+        last_balance = 0
 
         for entry in entries:
-            total_amount += entry.get("Amount", 0.0)
-            last_balance = entry.get("Balance", last_balance)
+            total_amount += entry.amount
+            last_balance = entry.balance
 
         return total_amount, last_balance
 
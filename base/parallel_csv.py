@@ -0,0 +1,91 @@
+"""Split big CSV files on record boundaries and parse the pieces in a process pool.
+
+A byte offset is a safe place to cut a CSV file only if it starts a line
+and is not inside a quoted field (descriptions may hold newlines). Quotes
+in well-formed CSV come in pairs (an escaped ``""`` counts twice), so a
+line start is outside every quoted field exactly when the number of quote
+bytes before it is even. Each range is then parsed on its own with
+csv.reader, and the results are merged back in file order.
+"""
+import csv
+import io
+import mmap
+import os
+
+# Below this a process pool costs more to start than it saves
+PARALLEL_MIN_BYTES = 16 << 20
+# Ranges per worker, so one slow range does not leave the others idle
+CHUNKS_PER_WORKER = 4
+
+
+def default_workers():
+    """Number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def record_chunks(path, begin, end, count):
+    """Split bytes [begin, end) of `path` into at most `count` (start, stop) ranges.
+
+    `begin` must itself be a record boundary (e.g. just after the header).
+    Every range starts on a record boundary, so each can be parsed alone.
+    """
+    if count <= 1 or end - begin < count:
+        return [(begin, end)]
+    bounds = [begin]
+    quotes = 0
+    scanned = begin
+    with open(path, mode="rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for step in range(1, count):
+            cut = max(begin + (end - begin) * step // count, bounds[-1])
+            while True:
+                newline = data.find(b"\n", cut, end)
+                if newline < 0:
+                    break
+                cut = newline + 1
+                quotes += data[scanned:cut].count(b'"')
+                scanned = cut
+                if quotes % 2 == 0:
+                    break
+            if newline < 0 or cut >= end:
+                break
+            if cut > bounds[-1]:
+                bounds.append(cut)
+    bounds.append(end)
+    return list(zip(bounds, bounds[1:]))
+
+
+def read_records(path, start, stop):
+    """Yield (line number within the range, record) for the CSV records in bytes [start, stop)."""
+    with open(path, mode="rb") as file:
+        file.seek(start)
+        text = file.read(stop - start).decode("utf-8")
+    reader = csv.reader(io.StringIO(text, newline=""))
+    for record in reader:
+        yield reader.line_num, record
+
+
+def read_header(path, encoding="utf-8"):
+    """Return (field names, byte offset of the first record) of a CSV file."""
+    with open(path, mode="rb") as file:
+        line = file.readline()
+    header = next(csv.reader([line.decode(encoding)]), [])
+    return header, len(line)
+
+
+def map_chunks(func, tasks, workers):
+    """Yield func(task) for every task, in task order, using up to `workers` processes.
+
+    With one worker or one task everything runs in this process.
+    """
+    if workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield func(task)
+        return
+    # Imported here: concurrent.futures pulls in multiprocessing, which every
+    # caller would otherwise pay for at startup even for small files
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        yield from pool.map(func, tasks)
@@ -0,0 +1,269 @@
+"""Typed transaction records and the filters shared by the streaming readers."""
+from datetime import date, datetime
+from sys import intern
+from typing import NamedTuple, Optional
+
+from chart_of_accounts import get_chart_of_accounts
+from money import cents_to_str, parse_cents
+
+_chart = get_chart_of_accounts()
+# Both grow in place as accounts are registered, so lookups through them stay current
+_account_names = _chart.names
+_account_ids = _chart.ids
+
+
+def iso_date(text):
+    """Normalise a YYYY-MM-DD date (zero padding optional) to ISO text, or None."""
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        try:
+            date.fromisoformat(text)
+            return text
+        except ValueError:
+            return None
+    try:
+        return datetime.strptime(text, '%Y-%m-%d').date().isoformat()
+    except (TypeError, ValueError):
+        return None
+
+
+class _Record:
+    """Base of the slotted record types: attributes, plus read access by field name.
+
+    ``FIELDS`` maps the column names used by transactions.csv and the views
+    ("Date", "Amount", ...) to attributes, so ``record["Date"]`` and
+    ``dict(record)`` still work for code that is generic over fields. Hot
+    paths read the attributes directly.
+    """
+    __slots__ = ()
+    FIELDS = {}
+
+    def __getitem__(self, field):
+        try:
+            return getattr(self, self.FIELDS[field])
+        except KeyError:
+            raise KeyError(field) from None
+
+    def get(self, field, default=None):
+        name = self.FIELDS.get(field)
+        return default if name is None else getattr(self, name)
+
+    def keys(self):
+        return self.FIELDS.keys()
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS.values())
+        return f"{type(self).__name__}({values})"
+
+
+# Usa ka transaksyon sa memorya, walay dict (Bisaya)
+class TransactionRow(_Record):
+    """One saved transaction as the store keeps it; `amount` is the text saved on disk.
+
+    The accounts are kept as chart-of-accounts IDs (`debit_id`,
+    `credit_id`); `debit` and `credit` look the names up when read. Dates
+    repeat on nearly every row, so they are interned: all rows share one
+    string per distinct date.
+    """
+    __slots__ = ("date", "description", "debit_id", "credit_id", "amount")
+    FIELDS = {"Date": "date", "Description": "description", "Debit": "debit", "Credit": "credit", "Amount": "amount"}
+
+    def __init__(self, date, description, debit, credit, amount):
+        self.date = intern(date)
+        self.description = description
+        # Known names are one dict lookup; id_of() registers new ones
+        self.debit_id = _account_ids.get(debit)
+        if self.debit_id is None:
+            self.debit_id = _chart.id_of(debit)
+        self.credit_id = _account_ids.get(credit)
+        if self.credit_id is None:
+            self.credit_id = _chart.id_of(credit)
+        self.amount = amount
+
+    @property
+    def debit(self):
+        return _account_names[self.debit_id]
+
+    @property
+    def credit(self):
+        return _account_names[self.credit_id]
+
+    @classmethod
+    def from_ids(cls, date, description, debit_id, credit_id, amount):
+        """Build a row whose account IDs are already known."""
+        row = cls.__new__(cls)
+        row.date = intern(date)
+        row.description = description
+        row.debit_id = debit_id
+        row.credit_id = credit_id
+        row.amount = amount
+        return row
+
+    @classmethod
+    def from_mapping(cls, row):
+        """Build a row from anything indexed by field name (a csv.DictReader row, a dict, a record)."""
+        return cls(row["Date"], row["Description"], row["Debit"], row["Credit"], row["Amount"])
+
+    def values(self):
+        """The field values in transactions.csv column order."""
+        return [self.date, self.description, self.debit, self.credit, self.amount]
+
+
+# Usa ka linya sa General Journal: debit o credit (Bisaya)
+class JournalLine(_Record):
+    """One side of a journal entry; `debit` or `credit` holds the amount text, the other is "".
+
+    The account is kept as its chart-of-accounts ID, `account_id`.
+    """
+    __slots__ = ("date", "description", "account_id", "debit", "credit")
+    FIELDS = {"Date": "date", "Description": "description", "Account": "account", "Debit": "debit", "Credit": "credit"}
+
+    def __init__(self, date, description, account_id, debit, credit):
+        self.date = date
+        self.description = description
+        self.account_id = account_id
+        self.debit = debit
+        self.credit = credit
+
+    @property
+    def account(self):
+        return _account_names[self.account_id]
+
+
+# Usa ka linya sa General Ledger nga naay running balance (Bisaya)
+class LedgerEntry(_Record):
+    """A transaction in the ledger; `amount` and `balance` are integer cents.
+
+    Accounts are chart-of-accounts IDs, as on TransactionRow. `side` is set
+    only on an account ledger: "Debit" or "Credit", the side the account is
+    on.
+    """
+    __slots__ = ("date", "description", "debit_id", "credit_id", "amount", "balance", "side")
+    FIELDS = {
+        "Date": "date", "Description": "description", "Debit": "debit", "Credit": "credit",
+        "Amount": "amount", "Balance": "balance", "Side": "side",
+    }
+
+    def __init__(self, date, description, debit_id, credit_id, amount, balance, side=None):
+        self.date = date
+        self.description = description
+        self.debit_id = debit_id
+        self.credit_id = credit_id
+        self.amount = amount
+        self.balance = balance
+        self.side = side
+
+    @property
+    def debit(self):
+        return _account_names[self.debit_id]
+
+    @property
+    def credit(self):
+        return _account_names[self.credit_id]
+
+
+class Transaction(NamedTuple):
+    """One saved transaction; `amount` is in integer cents."""
+    key: Optional[int]
+    date: str
+    description: str
+    debit: str
+    credit: str
+    amount: int
+
+    @classmethod
+    def from_row(cls, row, key=None):
+        """Build a record from a transactions.csv style row dictionary."""
+        return cls(key, row["Date"], row["Description"], row["Debit"], row["Credit"], parse_cents(row["Amount"]))
+
+    def to_row(self):
+        """The stored TransactionRow for this record."""
+        return TransactionRow(self.date, self.description, self.debit, self.credit, cents_to_str(self.amount))
+
+
+class TransactionFilter(NamedTuple):
+    """Conditions a streamed transaction must meet; None means "any".
+
+    Dates are inclusive YYYY-MM-DD bounds, `account` matches either side,
+    and amounts are inclusive bounds in integer cents.
+    """
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    account: Optional[str] = None
+    min_cents: Optional[int] = None
+    max_cents: Optional[int] = None
+
+    @classmethod
+    def build(cls, start_date=None, end_date=None, account=None, min_amount=None, max_amount=None):
+        """Validate user-facing arguments (amounts in currency units) into a filter."""
+        bounds = []
+        for value in (start_date, end_date):
+            if value is not None:
+                value = iso_date(value)
+                if value is None:
+                    raise ValueError("Date must be in YYYY-MM-DD format")
+            bounds.append(value)
+        return cls(
+            bounds[0],
+            bounds[1],
+            account,
+            parse_cents(min_amount) if min_amount is not None else None,
+            parse_cents(max_amount) if max_amount is not None else None,
+        )
+
+    def match_fields(self, date, debit, credit):
+        """Cheap string checks, done before the amount is parsed."""
+        if self.account is not None and self.account != debit and self.account != credit:
+            return False
+        if self.start_date is not None or self.end_date is not None:
+            date = iso_date(date)
+            if date is None:
+                return False
+            if self.start_date is not None and date < self.start_date:
+                return False
+            if self.end_date is not None and date > self.end_date:
+                return False
+        return True
+
+    def match_amount(self, cents):
+        if self.min_cents is not None and cents < self.min_cents:
+            return False
+        return self.max_cents is None or cents <= self.max_cents
+
+
+NO_FILTER = TransactionFilter()
+
+
+def filter_rows(keyed_rows, conditions=NO_FILTER):
+    """Yield a Transaction for every (key, TransactionRow) pair that meets `conditions`.
+
+    Rows whose amount is not a number are skipped with a warning. The
+    account condition is checked on chart-of-accounts IDs.
+    """
+    account_id = None
+    if conditions.account is not None:
+        account_id = _chart.find(conditions.account)
+        if account_id is None:
+            return
+        conditions = conditions._replace(account=None)
+    for key, row in keyed_rows:
+        if account_id is not None and row.debit_id != account_id and row.credit_id != account_id:
+            continue
+        if not conditions.match_fields(row.date, None, None):
+            continue
+        try:
+            cents = parse_cents(row.amount)
+        except (TypeError, ValueError):
+            print(f"Warning: Skipping transaction with invalid amount: {row}")
+            continue
+        if conditions.match_amount(cents):
+            yield Transaction(key, row.date, row.description, row.debit, row.credit, cents)
@@ -0,0 +1,223 @@
+"""Headless reports: trial balance, general journal, general ledger and balance sheet.
+
+Usage, from the base directory:
+
+    python reports.py trial-balance
+    python reports.py journal --start 2024-01-01 --end 2024-01-31
+    python reports.py ledger --account "Cash [ASSET]" --format csv -o cash.csv
+    python reports.py balance-sheet --as-of 2024-06-30
+
+The figures come from the same AccountsManager, GeneralJournal and
+GeneralLedger the GUI uses, but nothing here imports tkinter or
+tkcalendar, so nightly batch runs work on servers without a display.
+Reports print as aligned text, or as CSV with plain two-decimal amounts.
+"""
+import argparse
+import csv
+import sys
+from typing import List, NamedTuple
+
+from accounts_manager import AccountsManager
+from balance_snapshots import BalanceSnapshots
+from general_journal import GeneralJournal
+from general_ledger import GeneralLedger
+from money import cents_to_str, format_money, parse_cents
+from records import iso_date
+from transaction_store import get_store
+from trial_balance import TrialBalance
+
+FORMATS = ("text", "csv")
+
+
+class Report(NamedTuple):
+    """A finished report. Every int cell is an amount in cents; other cells are text.
+
+    `warning` says what is wrong with the figures, if anything (e.g. a
+    trial balance with postings to accounts outside the chart).
+    """
+    title: str
+    columns: tuple
+    rows: List[tuple]
+    totals: tuple = ()
+    warning: str = ""
+
+
+def _date_arg(text):
+    """argparse type for YYYY-MM-DD options: a typo is an error, not an empty report."""
+    value = iso_date(text)
+    if value is None:
+        raise argparse.ArgumentTypeError(f"invalid date {text!r}, expected YYYY-MM-DD")
+    return value
+
+
+def _cents(text):
+    try:
+        return parse_cents(text) if text else ""
+    except ValueError:
+        return ""
+
+
+def trial_balance_report(trial_balance, postings=False):
+    """Every account's balance (or its total postings) in debit and credit columns, with the totals."""
+    lines = trial_balance.get_lines(postings)
+    totals = trial_balance.get_totals(lines)
+    rows = [(line.account, line.account_type, line.debit or "", line.credit or "") for line in lines]
+    warning = "; ".join(trial_balance.find_problems())
+    return Report("Trial Balance (postings)" if postings else "Trial Balance", ("Account", "Type", "Debit", "Credit"),
+                  rows, ("Totals", "", totals.debits, totals.credits), warning)
+
+
+def journal_report(general_journal, search_term="", start_date=None, end_date=None):
+    """Journal lines (all, a date range or a search) with total debits and credits."""
+    if start_date or end_date:
+        entries = general_journal.get_journal_entries_by_date_range(start_date or "0001-01-01",
+                                                                    end_date or "9999-12-31")
+        if search_term:
+            matches = {id(entry) for entry in general_journal.search_journal_entries(search_term)}
+            entries = [entry for entry in entries if id(entry) in matches]
+    else:
+        entries = general_journal.search_journal_entries(search_term)
+    total_debits, total_credits = general_journal.get_totals(entries)
+    rows = [(entry.date, entry.description, entry.account, _cents(entry.debit), _cents(entry.credit))
+            for entry in entries]
+    return Report("General Journal", ("Date", "Description", "Account", "Debit", "Credit"), rows,
+                  ("", "", "Totals", total_debits, total_credits))
+
+
+def ledger_report(general_ledger, account_name=None, search_term=""):
+    """The whole ledger with its running balance, or one account's T-account view."""
+    columns = ("Date", "Description", "Debit Account", "Credit Account", "Amount", "Balance")
+    if account_name is None:
+        entries = general_ledger.search_entries(search_term)
+        total_amount, last_balance = general_ledger.get_totals(entries)
+        rows = [(entry.date, entry.description, entry.debit, entry.credit, entry.amount, entry.balance)
+                for entry in entries]
+        return Report("General Ledger", columns, rows, ("", "", "", "Totals", total_amount, last_balance))
+
+    if general_ledger.chart.find(account_name) is None:
+        raise ValueError(f"No transactions use the account {account_name!r}")
+    entries = general_ledger.get_account_ledger(account_name, search_term)
+    debits, credits, balance = general_ledger.get_account_totals(entries)
+    # Each posting goes in the column of the side this account is on
+    rows = [(entry.date, entry.description, entry.debit, entry.credit,
+             entry.amount if entry.side == "Debit" else "", entry.amount if entry.side == "Credit" else "",
+             entry.balance)
+            for entry in entries]
+    return Report(f"General Ledger: {account_name}", columns[:4] + ("Debit", "Credit", "Balance"), rows,
+                  ("", "", "", "Totals", debits, credits, balance))
+
+
+def balance_sheet_report(accounts_manager, as_of_date=None):
+    """Assets against liabilities and equity, now or as of a date, as on the Balance Sheet tab."""
+    sections, totals = accounts_manager.get_balance_sheet(as_of_date)
+    rows = []
+    for section, accounts in sections.items():
+        for account in accounts:
+            rows.append((section, account["name"], account["balance"]))
+    rows.append(("Total", "Assets", totals["Assets"]))
+    rows.append(("Total", "Liabilities & Equity", totals["Liabilities & Equity"]))
+    title = "Balance Sheet" + (f" as of {as_of_date}" if as_of_date else "")
+    return Report(title, ("Section", "Account", "Amount"), rows)
+
+
+def write_csv(report, file):
+    """Write the report as CSV: a header line, the rows, then the totals line if any."""
+    writer = csv.writer(file)
+    writer.writerow(report.columns)
+    for row in (report.rows + [report.totals]) if report.totals else report.rows:
+        writer.writerow([cents_to_str(cell) if type(cell) is int else cell for cell in row])
+
+
+def write_text(report, file):
+    """Write the report as a titled table with right-aligned amounts."""
+    table = report.rows + [report.totals] if report.totals else report.rows
+    widths = [len(column) for column in report.columns]
+    # Amount columns are the ones holding an int anywhere; they are right aligned
+    numeric = [False] * len(report.columns)
+    lines = []
+    for row in table:
+        line = []
+        for position, cell in enumerate(row):
+            if type(cell) is int:
+                numeric[position] = True
+                cell = format_money(cell)
+            else:
+                cell = str(cell)
+            widths[position] = max(widths[position], len(cell))
+            line.append(cell)
+        lines.append(line)
+
+    def render(cells):
+        return "  ".join(cell.rjust(width) if is_number else cell.ljust(width)
+                         for cell, width, is_number in zip(cells, widths, numeric)).rstrip()
+
+    rule = "  ".join("-" * width for width in widths)
+    file.write(f"{report.title}\n\n{render(report.columns)}\n{rule}\n")
+    for line in lines[:len(report.rows)]:
+        file.write(render(line) + "\n")
+    if report.totals:
+        file.write(f"{rule}\n{render(lines[-1])}\n")
+
+
+def build_report(args, store=None):
+    store = store if store is not None else get_store()
+    store.load()
+    if args.report == "trial-balance":
+        return trial_balance_report(TrialBalance(AccountsManager(store)), args.postings)
+    if args.report == "balance-sheet":
+        # Month-end snapshots stay in memory unless a file was asked for
+        with store.lock:
+            store.balance_snapshots = BalanceSnapshots(store, args.snapshots)
+        return balance_sheet_report(AccountsManager(store), args.as_of)
+    if args.report == "journal":
+        return journal_report(GeneralJournal(store), args.search, args.start, args.end)
+    return ledger_report(GeneralLedger(store, accounts_manager=AccountsManager(store)), args.account, args.search)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print or export accounting reports without the GUI.")
+    parser.add_argument("--format", choices=FORMATS, default="text", help="output format (default: text)")
+    parser.add_argument("-o", "--output", help="file to write (default: standard output)")
+    # The same options after the report name; unset ones keep the values given before it
+    output = argparse.ArgumentParser(add_help=False, argument_default=argparse.SUPPRESS)
+    output.add_argument("--format", choices=FORMATS, help="output format (default: text)")
+    output.add_argument("-o", "--output", help="file to write (default: standard output)")
+    reports = parser.add_subparsers(dest="report", required=True)
+    trial_balance = reports.add_parser("trial-balance", parents=[output],
+                                       help="debit and credit balance of every account")
+    trial_balance.add_argument("--postings", action="store_true",
+                               help="total debit and credit postings per account instead of balances")
+    journal = reports.add_parser("journal", parents=[output], help="general journal lines")
+    journal.add_argument("--start", type=_date_arg, help="first date, YYYY-MM-DD")
+    journal.add_argument("--end", type=_date_arg, help="last date, YYYY-MM-DD")
+    journal.add_argument("--search", default="", help="only transactions matching this text")
+    ledger = reports.add_parser("ledger", parents=[output], help="general ledger, or one account's ledger")
+    ledger.add_argument("--account", help="account name, e.g. \"Cash [ASSET]\"")
+    ledger.add_argument("--search", default="", help="only transactions matching this text")
+    balance_sheet = reports.add_parser("balance-sheet", parents=[output],
+                                       help="assets, liabilities and equity")
+    balance_sheet.add_argument("--as-of", type=_date_arg, help="balance date, YYYY-MM-DD (default: today)")
+    balance_sheet.add_argument("--snapshots", help="read and save month-end balance snapshots in this file "
+                                                   "(e.g. balance_snapshots.json, as the GUI does)")
+    args = parser.parse_args(argv)
+
+    try:
+        report = build_report(args)
+        write = write_csv if args.format == "csv" else write_text
+        if args.output:
+            with open(args.output, mode="w", newline="", encoding="utf-8") as file:
+                write(report, file)
+            print(f"✅ Wrote {report.title} ({len(report.rows)} rows) to {args.output}")
+        else:
+            write(report, sys.stdout)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error writing report: {str(e)}", file=sys.stderr)
+        return 1
+    if report.warning:
+        print(f"❌ {report.title}: {report.warning}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+from collections import defaultdict
+from operator import attrgetter
+
+from records import TransactionRow
+from transaction_store import REQUIRED_FIELDS, get_store
+
+GRAM_SIZE = 3
+
+
+def _grams(text):
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+# Index para paspas ang pagpangita sa Transactions, Journal ug Ledger (Bisaya)
+class SearchIndex:
+    """Trigram index for case-insensitive substring search over the store.
+
+    Every distinct lowercase value of a field maps to the keys of the rows
+    that hold it, and every trigram maps to the distinct values containing
+    it. A query intersects the trigram sets of the search term, confirms the
+    few surviving values with a plain substring test, and unions their row
+    keys. Terms shorter than a trigram scan the distinct values of each field
+    instead of the rows.
+
+    The index is built on the first search and then kept up to date through
+    the store's change notifications. The build works on a snapshot of the
+    rows without holding the store lock, so postings are not blocked while
+    a large ledger is indexed; the changes made meanwhile are applied to the
+    finished index before it is used.
+    """
+
+    def __init__(self, store=None):
+        self.store = store if store is not None else get_store()
+        self._built = False
+        self._values = {}
+        self._grams = {}
+        self._rows = {}
+        # One list per build in progress, collecting the store changes made since its snapshot
+        self._pending = []
+        self.store.subscribe(self._on_store_change)
+
+    def _build(self):
+        """Index a snapshot of the rows, then catch up with the changes made while indexing."""
+        while True:
+            with self.store.lock:
+                if self._built:
+                    return
+                items = self.store.get_items()
+                changes = []
+                self._pending.append(changes)
+
+            try:
+                values_by_field = {field: defaultdict(set) for field in REQUIRED_FIELDS}
+                grams_by_field = {field: defaultdict(set) for field in REQUIRED_FIELDS}
+                # Field by field with local lookups: this loop runs once per row and field
+                for field in REQUIRED_FIELDS:
+                    values = values_by_field[field]
+                    value_of = attrgetter(TransactionRow.FIELDS[field])
+                    for key, row in items:
+                        values[str(value_of(row)).lower()].add(key)
+                    grams = grams_by_field[field]
+                    for value in values:
+                        for i in range(len(value) - GRAM_SIZE + 1):
+                            grams[value[i:i + GRAM_SIZE]].add(value)
+            finally:
+                with self.store.lock:
+                    self._pending.remove(changes)
+
+            with self.store.lock:
+                if self._built:
+                    return
+                if any(event == "reload" for event, key, row in changes):
+                    # The snapshot is of rows that are gone; start again from the new ones
+                    continue
+                self._values = values_by_field
+                self._grams = grams_by_field
+                self._rows = dict(items)
+                for event, key, row in changes:
+                    if event == "add":
+                        self._add(key, row)
+                    else:
+                        self._remove(key, row)
+                self._built = True
+                return
+
+    def _add(self, key, row):
+        self._rows[key] = row
+        for field in REQUIRED_FIELDS:
+            value = str(row[field]).lower()
+            keys = self._values[field][value]
+            if not keys:
+                grams = self._grams[field]
+                for gram in _grams(value):
+                    grams[gram].add(value)
+            keys.add(key)
+
+    def _remove(self, key, row):
+        self._rows.pop(key, None)
+        for field in REQUIRED_FIELDS:
+            value = str(row[field]).lower()
+            values = self._values[field]
+            keys = values.get(value)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if keys:
+                continue
+            del values[value]
+            grams = self._grams[field]
+            for gram in _grams(value):
+                holders = grams.get(gram)
+                if holders is not None:
+                    holders.discard(value)
+                    if not holders:
+                        del grams[gram]
+
+    def _on_store_change(self, event, row, index, key):
+        for changes in self._pending:
+            changes.append((event, key, row))
+        if not self._built:
+            return
+        if event == "add":
+            self._add(key, row)
+        elif event == "remove":
+            self._remove(key, row)
+        else:
+            self._built = False
+
+    def _matching_values(self, field, term):
+        values = self._values[field]
+        if len(term) < GRAM_SIZE:
+            return [value for value in values if term in value]
+
+        grams = self._grams[field]
+        candidate_sets = []
+        for gram in _grams(term):
+            holders = grams.get(gram)
+            if not holders:
+                return []
+            candidate_sets.append(holders)
+        candidate_sets.sort(key=len)
+        candidates = set(candidate_sets[0])
+        for holders in candidate_sets[1:]:
+            candidates &= holders
+            if not candidates:
+                return []
+        # Trigrams can match out of order, so confirm each candidate
+        return [value for value in candidates if term in value]
+
+    def search_keys(self, search_term, fields=REQUIRED_FIELDS):
+        """Return the keys of rows where any of `fields` contains the term, in file order."""
+        term = search_term.lower()
+        with self.store.lock:
+            backend_search = getattr(self.store.backend, "search_keys", None)
+            if term and backend_search is not None:
+                # The database has its own index; keep only rows this process knows
+                return [key for key in backend_search(search_term, fields) if self.store.get_row(key) is not None]
+
+        if not self._built:
+            self._build()
+        with self.store.lock:
+            if not self._built:
+                # Reloaded since the build finished
+                self._build()
+            if not term:
+                return list(self.store.get_keys())
+
+            matches = set()
+            for field in fields:
+                values = self._values[field]
+                for value in self._matching_values(field, term):
+                    matches |= values[value]
+            return sorted(matches)
+
+    def search(self, search_term, fields=REQUIRED_FIELDS):
+        """Return the matching rows themselves, in file order."""
+        keys = self.search_keys(search_term, fields)
+        with self.store.lock:
+            # Rows deleted since the search are left out
+            return [self._rows[key] for key in keys if key in self._rows]
+
+
+def get_search_index(store=None):
+    """Return the SearchIndex shared by every view of `store` (default: the shared store)."""
+    store = store if store is not None else get_store()
+    with store.lock:
+        if store.search_index is None:
+            store.search_index = SearchIndex(store)
+        return store.search_index
@@ -0,0 +1,203 @@
+import sqlite3
+import threading
+
+from money import parse_cents
+from records import NO_FILTER, Transaction, TransactionRow
+from storage_backends import FILENAME, REQUIRED_FIELDS, read_csv_rows
+
+DB_FILENAME = "transactions.db"
+
+# Store field -> table column
+COLUMNS = {
+    "Date": "date",
+    "Description": "description",
+    "Debit": "debit",
+    "Credit": "credit",
+    "Amount": "amount",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    description TEXT NOT NULL,
+    debit TEXT NOT NULL,
+    credit TEXT NOT NULL,
+    amount TEXT NOT NULL,
+    amount_cents INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions (date);
+CREATE INDEX IF NOT EXISTS idx_transactions_debit ON transactions (debit);
+CREATE INDEX IF NOT EXISTS idx_transactions_credit ON transactions (credit);
+"""
+
+# Trigram full-text index so substring searches are indexed too (SQLite 3.34+)
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS transactions_fts USING fts5(
+    date, description, debit, credit, amount,
+    content='transactions', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS transactions_fts_insert AFTER INSERT ON transactions BEGIN
+    INSERT INTO transactions_fts (rowid, date, description, debit, credit, amount)
+    VALUES (new.id, new.date, new.description, new.debit, new.credit, new.amount);
+END;
+CREATE TRIGGER IF NOT EXISTS transactions_fts_delete AFTER DELETE ON transactions BEGIN
+    INSERT INTO transactions_fts (transactions_fts, rowid, date, description, debit, credit, amount)
+    VALUES ('delete', old.id, old.date, old.description, old.debit, old.credit, old.amount);
+END;
+"""
+
+
+def _to_cents(amount):
+    try:
+        return parse_cents(amount)
+    except ValueError:
+        return 0
+
+
+# Ledger sa SQLite nga naay index sa petsa ug accounts (Bisaya)
+class SQLiteBackend:
+    """TransactionStore backend that keeps transactions in a local SQLite database.
+
+    The table is indexed on date, debit account and credit account, and
+    mirrored into a trigram FTS5 table when SQLite supports it. Besides the
+    load/append/delete calls the store makes, the backend answers date
+    ranges and searches as indexed queries. The database
+    runs in WAL mode with a busy timeout, so several clerks can post to the
+    same file; every write is its own transaction.
+
+    A new database is seeded from transactions.csv.
+    """
+
+    def __init__(self, path=DB_FILENAME, seed_csv=FILENAME, timeout=30.0):
+        self.path = path
+        self.seed_csv = seed_csv
+        self._lock = threading.RLock()
+        self.connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+        self.has_fts = self._create_fts()
+        self._seed()
+
+    def _create_fts(self):
+        existed = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'transactions_fts'"
+        ).fetchone()
+        try:
+            with self.connection:
+                self.connection.executescript(FTS_SCHEMA)
+                if not existed:
+                    # Index rows written before the full-text table existed
+                    self.connection.execute("INSERT INTO transactions_fts (transactions_fts) VALUES ('rebuild')")
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+    def _seed(self):
+        with self._lock:
+            count = self.connection.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+            if count or not self.seed_csv:
+                return
+            rows = read_csv_rows(self.seed_csv)
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT INTO transactions (date, description, debit, credit, amount, amount_cents) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (row.values() + [_to_cents(row.amount)] for row in rows)
+                )
+
+    def load(self):
+        with self._lock:
+            cursor = self.connection.execute(
+                "SELECT id, date, description, debit, credit, amount FROM transactions ORDER BY id"
+            )
+            keys, rows = [], []
+            for record in cursor:
+                keys.append(record[0])
+                rows.append(TransactionRow(*record[1:]))
+            return keys, rows
+
+    def append(self, row):
+        with self._lock, self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO transactions (date, description, debit, credit, amount, amount_cents) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                row.values() + [_to_cents(row.amount)]
+            )
+            return cursor.lastrowid
+
+    def append_many(self, rows):
+        """Insert several rows in one transaction; return their IDs."""
+        with self._lock, self.connection:
+            keys = []
+            for row in rows:
+                cursor = self.connection.execute(
+                    "INSERT INTO transactions (date, description, debit, credit, amount, amount_cents) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    row.values() + [_to_cents(row.amount)]
+                )
+                keys.append(cursor.lastrowid)
+            return keys
+
+    def delete(self, key, row, remaining_rows):
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM transactions WHERE id = ?", (key,))
+
+    def iter_transactions(self, conditions=NO_FILTER, batch_size=1000):
+        """Stream matching Transactions; every filter becomes part of the indexed query."""
+        where, params = [], []
+        if conditions.start_date is not None:
+            where.append("date >= ?")
+            params.append(conditions.start_date)
+        if conditions.end_date is not None:
+            where.append("date <= ?")
+            params.append(conditions.end_date)
+        if conditions.account is not None:
+            where.append("(debit = ? OR credit = ?)")
+            params += [conditions.account, conditions.account]
+        if conditions.min_cents is not None:
+            where.append("amount_cents >= ?")
+            params.append(conditions.min_cents)
+        if conditions.max_cents is not None:
+            where.append("amount_cents <= ?")
+            params.append(conditions.max_cents)
+        query = "SELECT id, date, description, debit, credit, amount_cents FROM transactions"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+
+        with self._lock:
+            cursor = self.connection.execute(query + " ORDER BY id", params)
+        # Fetch in batches so other threads can use the connection in between
+        while True:
+            with self._lock:
+                batch = cursor.fetchmany(batch_size)
+            if not batch:
+                return
+            for record in batch:
+                yield Transaction(*record)
+
+    def search_keys(self, search_term, fields=REQUIRED_FIELDS):
+        """IDs of transactions where any of `fields` contains the term (case-insensitive)."""
+        columns = [COLUMNS[field] for field in fields]
+        with self._lock:
+            if self.has_fts and len(search_term) >= 3:
+                phrase = '"' + search_term.replace('"', '""') + '"'
+                query = "{" + " ".join(columns) + "} : " + phrase
+                cursor = self.connection.execute(
+                    "SELECT rowid FROM transactions_fts WHERE transactions_fts MATCH ? ORDER BY rowid",
+                    (query,)
+                )
+            else:
+                pattern = "%" + search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+                where = " OR ".join(f"{column} LIKE ? ESCAPE '\\'" for column in columns)
+                cursor = self.connection.execute(
+                    f"SELECT id FROM transactions WHERE {where} ORDER BY id",
+                    [pattern] * len(columns)
+                )
+            return [record[0] for record in cursor]
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
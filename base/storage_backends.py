@@ -0,0 +1,413 @@
+import csv
+import io
+import os
+import threading
+from itertools import starmap
+from operator import itemgetter
+
+from file_watcher import FileWatcher
+from money import parse_cents
+from parallel_csv import (CHUNKS_PER_WORKER, PARALLEL_MIN_BYTES, default_workers, map_chunks, read_header,
+                          read_records, record_chunks)
+from records import NO_FILTER, Transaction, TransactionRow
+
+FILENAME = "transactions.csv"
+LOG_FILENAME = "transactions.log"
+REQUIRED_FIELDS = ["Date", "Description", "Debit", "Credit", "Amount"]
+
+
+def _rows_from_reader(reader):
+    rows = []
+    for row in reader:
+        if all(row.get(key) is not None for key in REQUIRED_FIELDS):
+            rows.append(TransactionRow.from_mapping(row))
+        else:
+            print(f"Warning: Skipping malformed transaction row: {row}")
+    return rows
+
+
+def _parse_range(task):
+    """Process-pool worker: the field tuples of the transaction records in one byte range."""
+    filename, start, stop, columns = task
+    width = max(columns)
+    fields = itemgetter(*columns)
+    parsed = []
+    for _, record in read_records(filename, start, stop):
+        if not record:
+            continue
+        if len(record) <= width:
+            print(f"Warning: Skipping malformed transaction row: {record}")
+            continue
+        parsed.append(fields(record))
+    return parsed
+
+
+def read_csv_rows(filename):
+    """Parse a transactions.csv style file into a list of TransactionRows."""
+    if not os.path.exists(filename):
+        return []
+
+    with open(filename, mode="r", newline="", encoding="utf-8") as file:
+        return _rows_from_reader(csv.DictReader(file))
+
+
+def _stream_records(reader, conditions, columns, key_of):
+    """Yield Transactions from csv records; `columns` are the field positions."""
+    date_at, desc_at, debit_at, credit_at, amount_at = columns
+    width = max(columns)
+    count = 0
+    for record in reader:
+        if not record:
+            continue
+        if len(record) <= width:
+            print(f"Warning: Skipping malformed transaction row: {record}")
+            continue
+        key = key_of(record, count)
+        count += 1
+        if key is None:
+            continue
+        # String filters first; the amount is parsed only for rows that pass
+        if not conditions.match_fields(record[date_at], record[debit_at], record[credit_at]):
+            continue
+        try:
+            cents = parse_cents(record[amount_at])
+        except ValueError:
+            print(f"Warning: Skipping transaction with invalid amount: {record}")
+            continue
+        if conditions.match_amount(cents):
+            yield Transaction(key, record[date_at], record[desc_at], record[debit_at], record[credit_at], cents)
+
+
+def write_csv_rows(filename, rows):
+    """Write rows to a transactions.csv style file, header included."""
+    with open(filename, mode="w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(REQUIRED_FIELDS)
+        writer.writerows([row[key] for key in REQUIRED_FIELDS] for row in rows)
+
+
+# Ang orihinal nga paagi: usa ka linya kada transaksyon sa transactions.csv (Bisaya)
+class CsvBackend:
+    """Storage in the plain transactions.csv file.
+
+    Rows carry no ID on disk, so the store numbers them itself. Deleting
+    rewrites the whole file from the rows that remain.
+
+    A FileWatcher remembers how much of the file has been read, so
+    read_changes() can tell an untouched file from one that another program
+    appended to (only the new lines are parsed) or rewrote.
+
+    Files of PARALLEL_MIN_BYTES or more are split into record-aligned byte
+    ranges and parsed by `workers` processes (default: one per CPU).
+    """
+
+    def __init__(self, filename=FILENAME, workers=None):
+        self.filename = filename
+        self.workers = workers if workers is not None else default_workers()
+        self.watcher = FileWatcher(filename)
+        self._fieldnames = None
+
+    def load(self):
+        """Return (keys, rows); keys is None when the format has no IDs."""
+        if not os.path.exists(self.filename):
+            self.watcher.reset()
+            return None, []
+        size = os.path.getsize(self.filename)
+        if self.workers > 1 and size >= PARALLEL_MIN_BYTES:
+            rows = self._load_parallel(size)
+            if rows is not None:
+                return None, rows
+        with open(self.filename, mode="r", newline="", encoding="utf-8") as file:
+            reader = csv.DictReader(file)
+            rows = _rows_from_reader(reader)
+            self._fieldnames = reader.fieldnames
+            # Exactly the bytes parsed, even if the file grew meanwhile
+            self.watcher.mark(file.buffer.tell())
+        return None, rows
+
+    def _load_parallel(self, size):
+        header, start = read_header(self.filename)
+        if any(field not in header for field in REQUIRED_FIELDS):
+            return None
+        columns = [header.index(field) for field in REQUIRED_FIELDS]
+        chunks = record_chunks(self.filename, start, size, self.workers * CHUNKS_PER_WORKER)
+        tasks = [(self.filename, chunk_start, chunk_stop, columns) for chunk_start, chunk_stop in chunks]
+        rows = []
+        # Account IDs are per process, so rows are built here from the parsed fields
+        for parsed in map_chunks(_parse_range, tasks, self.workers):
+            rows.extend(starmap(TransactionRow, parsed))
+        self._fieldnames = header
+        self.watcher.mark(size)
+        return rows
+
+    def iter_transactions(self, conditions=NO_FILTER):
+        """Stream matching Transactions straight from the file, one line at a time.
+
+        Keys are row numbers, as the store numbers a freshly loaded file.
+        """
+        if not os.path.exists(self.filename):
+            return
+        with open(self.filename, mode="r", newline="", encoding="utf-8") as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return
+            try:
+                columns = [header.index(field) for field in REQUIRED_FIELDS]
+            except ValueError:
+                print(f"Warning: transactions file has an unexpected header: {header}")
+                return
+            yield from _stream_records(reader, conditions, columns, lambda record, count: count)
+
+    def read_changes(self):
+        """Return ("unchanged", []), ("appended", new_rows) or ("changed", None)."""
+        kind, offset = self.watcher.check()
+        if kind == "appended" and not self._fieldnames:
+            # No header was read yet, so the new lines cannot be parsed alone
+            kind = "changed"
+        if kind != "appended":
+            return kind, ([] if kind == "unchanged" else None)
+
+        with open(self.filename, mode="rb") as file:
+            file.seek(offset)
+            data = file.read()
+        # A line still being written is left for the next check
+        end = data.rfind(b"\n") + 1
+        text = data[:end].decode("utf-8")
+        rows = _rows_from_reader(csv.DictReader(io.StringIO(text, newline=""), fieldnames=self._fieldnames))
+        self.watcher.mark(offset + end)
+        return "appended", rows
+
+    def append(self, row):
+        # Only our own line is new if nobody else touched the file since the last read
+        unchanged = self.watcher.check()[0] == "unchanged"
+        with open(self.filename, mode="a", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow([row[key] for key in REQUIRED_FIELDS])
+        if unchanged:
+            self.watcher.mark()
+        else:
+            self.watcher.reset()
+        return None
+
+    def append_many(self, rows):
+        """Append several rows with one buffered write; like append(), there are no IDs."""
+        unchanged = self.watcher.check()[0] == "unchanged"
+        new_file = not os.path.exists(self.filename) or os.path.getsize(self.filename) == 0
+        with open(self.filename, mode="a", newline="", encoding="utf-8", buffering=1 << 20) as file:
+            writer = csv.writer(file)
+            if new_file:
+                writer.writerow(REQUIRED_FIELDS)
+                self._fieldnames = REQUIRED_FIELDS
+            writer.writerows(row.values() for row in rows)
+        if unchanged:
+            self.watcher.mark()
+        else:
+            self.watcher.reset()
+        return None
+
+    def delete(self, key, row, remaining_rows):
+        # The file is rewritten from `remaining_rows`, which would erase
+        # anything another program wrote since the last read
+        if self.watcher.check()[0] != "unchanged":
+            raise ValueError("Transactions file changed on disk since it was read; refresh and try again")
+        write_csv_rows(self.filename, remaining_rows)
+        self._fieldnames = REQUIRED_FIELDS
+        self.watcher.mark()
+
+
+# Journal file nga dugang ra og dugang; ang pag-delete kay tombstone lang (Bisaya)
+class AppendLogBackend:
+    """Append-only transaction journal with stable IDs and tombstone deletes.
+
+    Every line of the log is ``Op,ID,Date,Description,Debit,Credit,Amount``.
+    ``A`` adds transaction ``ID``; ``D`` is a tombstone that deletes it.
+    Posting and deleting are both a single appended line, whatever the size
+    of the ledger. Once tombstones make up a large share of the log, a
+    background thread compacts it: the live ``A`` records are rewritten to a
+    temporary file, anything appended meanwhile is copied across, and the
+    temporary file atomically replaces the log.
+
+    A missing log is seeded from transactions.csv, so switching modes keeps
+    the existing history.
+    """
+
+    HEADER = ["Op", "ID"] + REQUIRED_FIELDS
+    COMPACT_MIN_TOMBSTONES = 1000
+    COMPACT_RATIO = 0.25
+
+    def __init__(self, filename=LOG_FILENAME, seed_csv=FILENAME):
+        self.filename = filename
+        self.seed_csv = seed_csv
+        self._lock = threading.RLock()
+        self._next_id = 1
+        self._records = 0
+        self._tombstones = 0
+        self._compacting = False
+
+    def _seed(self):
+        rows = read_csv_rows(self.seed_csv) if self.seed_csv else []
+        with open(self.filename, mode="w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(self.HEADER)
+            for number, row in enumerate(rows, start=1):
+                writer.writerow(["A", number] + [row[key] for key in REQUIRED_FIELDS])
+
+    def load(self):
+        with self._lock:
+            if not os.path.exists(self.filename):
+                self._seed()
+
+            live = {}
+            records = tombstones = 0
+            highest = 0
+            with open(self.filename, mode="r", newline="", encoding="utf-8") as file:
+                reader = csv.reader(file)
+                next(reader, None)
+                for record in reader:
+                    if len(record) < 2:
+                        continue
+                    try:
+                        record_id = int(record[1])
+                    except ValueError:
+                        print(f"Warning: Skipping malformed log record: {record}")
+                        continue
+                    highest = max(highest, record_id)
+                    records += 1
+                    if record[0] == "A" and len(record) == len(self.HEADER):
+                        live[record_id] = TransactionRow(*record[2:])
+                    elif record[0] == "D":
+                        tombstones += 1
+                        live.pop(record_id, None)
+                    else:
+                        print(f"Warning: Skipping malformed log record: {record}")
+
+            self._next_id = highest + 1
+            self._records = records
+            self._tombstones = tombstones
+            keys = sorted(live)
+            return keys, [live[key] for key in keys]
+
+    def iter_transactions(self, conditions=NO_FILTER):
+        """Stream matching live Transactions from the log without loading it.
+
+        A first pass collects the tombstoned IDs (usually few), a second
+        streams the add records that were not deleted.
+        """
+        if not os.path.exists(self.filename):
+            return
+        deleted = set()
+        with open(self.filename, mode="r", newline="", encoding="utf-8") as file:
+            reader = csv.reader(file)
+            next(reader, None)
+            for record in reader:
+                if len(record) >= 2 and record[0] == "D":
+                    deleted.add(record[1])
+
+        def live_id(record, count):
+            if record[0] != "A" or record[1] in deleted or not record[1].isdigit():
+                return None
+            return int(record[1])
+
+        with open(self.filename, mode="r", newline="", encoding="utf-8") as file:
+            reader = csv.reader(file)
+            next(reader, None)
+            columns = [2 + position for position in range(len(REQUIRED_FIELDS))]
+            yield from _stream_records(reader, conditions, columns, live_id)
+
+    def _write(self, record):
+        with open(self.filename, mode="a", newline="", encoding="utf-8") as file:
+            csv.writer(file).writerow(record)
+        self._records += 1
+
+    def append(self, row):
+        with self._lock:
+            record_id = self._next_id
+            self._next_id += 1
+            self._write(["A", record_id] + [row[key] for key in REQUIRED_FIELDS])
+            return record_id
+
+    def append_many(self, rows):
+        """Append an ``A`` record per row in one buffered write; return the new IDs."""
+        with self._lock:
+            first = self._next_id
+            self._next_id += len(rows)
+            with open(self.filename, mode="a", newline="", encoding="utf-8", buffering=1 << 20) as file:
+                csv.writer(file).writerows(
+                    ["A", first + offset] + row.values() for offset, row in enumerate(rows)
+                )
+            self._records += len(rows)
+            return list(range(first, first + len(rows)))
+
+    def delete(self, key, row, remaining_rows):
+        with self._lock:
+            self._write(["D", key] + [""] * len(REQUIRED_FIELDS))
+            self._tombstones += 1
+            if self._should_compact():
+                self.compact_in_background()
+
+    def _should_compact(self):
+        return (
+            not self._compacting
+            and self._tombstones >= self.COMPACT_MIN_TOMBSTONES
+            and self._tombstones >= self._records * self.COMPACT_RATIO
+        )
+
+    def compact_in_background(self):
+        with self._lock:
+            if self._compacting:
+                return None
+            self._compacting = True
+        thread = threading.Thread(target=self.compact, daemon=True)
+        thread.start()
+        return thread
+
+    def compact(self):
+        """Fold tombstones into the log so it only holds live transactions."""
+        try:
+            with self._lock:
+                self._compacting = True
+                snapshot_size = os.path.getsize(self.filename)
+
+            # Read and rewrite up to the snapshot without blocking new postings
+            live = {}
+            highest = 0
+            with open(self.filename, mode="rb") as file:
+                text = file.read(snapshot_size).decode("utf-8")
+                reader = csv.reader(io.StringIO(text, newline=""))
+                next(reader, None)
+                for record in reader:
+                    if len(record) < 2 or not record[1].isdigit():
+                        continue
+                    highest = max(highest, int(record[1]))
+                    if record[0] == "A":
+                        live[record[1]] = record
+                    elif record[0] == "D":
+                        live.pop(record[1], None)
+
+            temp_name = self.filename + ".compact"
+            with open(temp_name, mode="w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(self.HEADER)
+                writer.writerows(live.values())
+                kept_tombstones = 0
+                if highest and str(highest) not in live:
+                    # Keep the newest tombstone so IDs are never handed out twice
+                    writer.writerow(["D", highest] + [""] * len(REQUIRED_FIELDS))
+                    kept_tombstones = 1
+
+            with self._lock:
+                # Carry over whatever was appended while we were rewriting
+                with open(self.filename, mode="rb") as source, open(temp_name, mode="ab") as target:
+                    source.seek(snapshot_size)
+                    tail = source.read()
+                    target.write(tail)
+                os.replace(temp_name, self.filename)
+                tail_records = tail.count(b"\n")
+                tail_tombstones = tail.count(b"\nD,") + (1 if tail.startswith(b"D,") else 0)
+                self._records = len(live) + kept_tombstones + tail_records
+                self._tombstones = kept_tombstones + tail_tombstones
+        except Exception as e:
+            print(f"❌ Error compacting transaction log: {str(e)}")
+        finally:
+            self._compacting = False
@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The modules live flat in base/ and import each other by top-level name
+sys.path.insert(0, BASE_DIR)
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path, monkeypatch):
+    """Run every test in its own directory, so relative data files never land in the tree."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
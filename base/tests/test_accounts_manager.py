@@ -0,0 +1,32 @@
+import threading
+
+from accounts_manager import AccountsManager
+from transaction_store import TransactionStore
+
+ROWS = [
+    {"Date": "2024-01-05", "Description": "Capital", "Debit": "Cash [ASSET]",
+     "Credit": "Owner's Capital [EQUITY]", "Amount": "500.00"},
+]
+POSTING = {"Date": "2024-01-06", "Description": "Sale", "Debit": "Cash [ASSET]",
+           "Credit": "Sales Revenue [INCOME]", "Amount": "700.00"}
+
+
+def test_posting_during_the_balance_build_is_not_lost():
+    store = TransactionStore.from_rows(ROWS)
+    manager = AccountsManager(store)
+    compute = manager._balances_by_id
+    poster = threading.Thread(target=store.add, args=(POSTING,))
+
+    def slow_compute():
+        balances = compute()
+        # A transaction saved on the Tk thread while the loader thread is still building
+        poster.start()
+        poster.join(timeout=0.5)
+        return balances
+
+    manager._balances_by_id = slow_compute
+    manager.get_account_balances()
+    poster.join()
+
+    assert manager.get_account_balances()["Cash [ASSET]"] == 120000
+    assert manager.get_total_by_type("Assets") == 120000
@@ -0,0 +1,37 @@
+import pytest
+
+import balance_columns
+from balance_columns import BalanceColumns
+from money import parse_cents
+from transaction_store import TransactionStore
+
+# Above 2**53 cents in total, with negatives, so float sums would round
+AMOUNTS = ["0.01", "12.50", "-3.25", "671088.64", "90071992547409.93", "-45035996273704.97"]
+TOTAL = sum(parse_cents(amount) for amount in AMOUNTS)
+
+
+def make_columns():
+    rows = [{"Date": "2024-01-05", "Description": f"Posting {number}", "Debit": debit, "Credit": credit,
+             "Amount": amount}
+            for number, amount in enumerate(AMOUNTS)
+            for debit, credit in (("Cash [ASSET]", "Sales Revenue [INCOME]"),
+                                  ("Rent Expense [EXPENSE]", "Cash [ASSET]"))]
+    return BalanceColumns(TransactionStore.from_rows(rows))
+
+
+@pytest.mark.parametrize("use_numpy, add_at", [(False, False), (True, True), (True, False)])
+def test_grouped_sums_are_exact(use_numpy, add_at, monkeypatch):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    if not add_at:
+        # The np.bincount path of NumPy before 1.25, in small chunks so the chunking is exercised too
+        monkeypatch.setattr(balance_columns, "_FAST_ADD_AT", (99, 0))
+        monkeypatch.setattr(balance_columns, "_BINCOUNT_CHUNK", 4)
+    columns = make_columns()
+
+    balances = columns.account_balances(use_numpy)
+    assert (balances["Sales Revenue [INCOME]"], balances["Rent Expense [EXPENSE]"], balances["Cash [ASSET]"]) == \
+        (-TOTAL, TOTAL, 0)
+    debits, credits = columns.posting_totals_by_id(use_numpy)
+    cash = columns.chart.find("Cash [ASSET]")
+    assert (debits[cash], credits[cash]) == (TOTAL, TOTAL)
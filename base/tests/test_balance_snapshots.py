@@ -0,0 +1,47 @@
+from balance_snapshots import BalanceSnapshots
+from transaction_store import TransactionStore
+
+
+def row(date, amount, debit="Cash [ASSET]", credit="Sales Revenue [INCOME]"):
+    return {"Date": date, "Description": f"On {date}", "Debit": debit, "Credit": credit, "Amount": amount}
+
+
+ROWS = [row("2024-01-10", "100.00"), row("2024-02-10", "20.00"), row("2024-04-10", "3.00")]
+MONTH_ENDS = ("2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30")
+
+
+def cash(snapshots, date):
+    return snapshots.balances_as_of(date)["Cash [ASSET]"]
+
+
+def test_back_dated_posting_moves_every_later_month_end():
+    store = TransactionStore.from_rows(ROWS)
+    snapshots = BalanceSnapshots(store)
+    assert [cash(snapshots, date) for date in MONTH_ENDS] == [10000, 12000, 12000, 12300]
+
+    store.add(row("2024-01-20", "0.50"))
+    store.add(row("2024-03-01", "7.00"))
+
+    assert [cash(snapshots, date) for date in MONTH_ENDS] == [10050, 12050, 12750, 13050]
+    assert cash(snapshots, "2024-01-15") == 10000
+
+
+def test_back_dated_deletion_moves_every_later_month_end():
+    store = TransactionStore.from_rows(ROWS)
+    snapshots = BalanceSnapshots(store)
+    assert cash(snapshots, "2024-04-30") == 12300
+
+    store.delete(store.get_keys()[0])
+
+    assert [cash(snapshots, date) for date in MONTH_ENDS] == [0, 2000, 2000, 2300]
+
+
+def test_saved_months_after_a_changed_month_are_recomputed():
+    store = TransactionStore.from_rows(ROWS)
+    BalanceSnapshots(store, "snapshots.json").balances_as_of("2024-04-30")
+
+    # The next start finds February changed: it and every later month are recomputed
+    rows = ROWS[:1] + [row("2024-02-10", "25.00")] + ROWS[2:]
+    snapshots = BalanceSnapshots(TransactionStore.from_rows(rows), "snapshots.json")
+
+    assert [cash(snapshots, date) for date in MONTH_ENDS] == [10000, 12500, 12500, 12800]
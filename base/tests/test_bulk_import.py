@@ -0,0 +1,53 @@
+import csv
+import json
+
+from bulk_import import import_transactions
+from transaction_store import TransactionStore
+
+RECORD = {"Date": "2024-1-5", "Description": "Coffee", "Debit": "Cash [ASSET]",
+          "Credit": "Sales Revenue [INCOME]", "Amount": "12.5"}
+FIELDS = [RECORD[field] for field in ("Date", "Description", "Debit", "Credit", "Amount")]
+
+
+def errors_of(report):
+    with open(report.error_path, newline="", encoding="utf-8") as file:
+        return [(row["Line"], row["Error"]) for row in csv.DictReader(file)]
+
+
+def test_jsonl_lines_that_are_not_objects_are_rejected():
+    with open("bank.jsonl", mode="w", encoding="utf-8") as file:
+        for record in (RECORD, [1], FIELDS, "text"):
+            file.write(json.dumps(record) + "\n")
+    store = TransactionStore.from_rows([])
+
+    report = import_transactions("bank.jsonl", store=store)
+
+    assert (report.imported, report.rejected) == (1, 3)
+    assert errors_of(report) == [("2", "Record is not an object"), ("3", "Record is not an object"),
+                                 ("4", "Record is not an object")]
+    assert [(row.date, row.amount) for row in store.get_rows()] == [("2024-01-05", "12.50")]
+
+
+def test_json_array_of_field_lists_is_rejected():
+    with open("bank.json", mode="w", encoding="utf-8") as file:
+        json.dump([FIELDS, RECORD], file)
+    store = TransactionStore.from_rows([])
+
+    report = import_transactions("bank.json", store=store)
+
+    assert (report.imported, report.rejected) == (1, 1)
+    assert errors_of(report) == [("1", "Record is not an object")]
+
+
+def test_csv_rows_are_imported_and_bad_ones_reported():
+    with open("bank.csv", mode="w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(RECORD)
+        writer.writerow(FIELDS)
+        writer.writerow(FIELDS[:4] + ["abc"])
+    store = TransactionStore.from_rows([])
+
+    report = import_transactions("bank.csv", store=store, workers=1)
+
+    assert (report.imported, report.rejected) == (1, 1)
+    assert errors_of(report) == [("3", "Amount must be a valid number")]
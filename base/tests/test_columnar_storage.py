@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from columnar_storage import ColumnarBackend, load_columns
+from storage_backends import write_csv_rows
+from transaction_store import TransactionStore
+
+ROWS = [
+    {"Date": "2024-01-05", "Description": "Coffee", "Debit": "Cash [ASSET]",
+     "Credit": "Sales Revenue [INCOME]", "Amount": "12.50"},
+    {"Date": "2024-1-6", "Description": "Rent", "Debit": "Rent Expense [EXPENSE]",
+     "Credit": "Cash [ASSET]", "Amount": "300.00"},
+    {"Date": "2024-01-07", "Description": "Typo", "Debit": "Cash [ASSET]",
+     "Credit": "Sales Revenue [INCOME]", "Amount": "12,5O"},
+    {"Date": "2024-13-01", "Description": "No such month", "Debit": "Cash [ASSET]",
+     "Credit": "Sales Revenue [INCOME]", "Amount": "1.00"},
+]
+ROW = {"Date": "2025-1-5", "Description": "Sale", "Debit": "Cash [ASSET]",
+       "Credit": "Sales Revenue [INCOME]", "Amount": "20.00"}
+
+
+def columnar_store():
+    store = TransactionStore(ColumnarBackend("transactions.cols", "transactions.csv"))
+    store.load()
+    return store
+
+
+def test_seed_skips_bad_rows_and_normalises_dates(capsys):
+    write_csv_rows("transactions.csv", ROWS)
+
+    store = columnar_store()
+
+    assert [(row.date, row.description) for row in store.get_rows()] == [
+        ("2024-01-05", "Coffee"), ("2024-01-06", "Rent")]
+    assert capsys.readouterr().out.count("Warning: Skipping") == 2
+    store.add(ROW)
+    assert load_columns("transactions.cols").rows()[-1].date == "2025-01-05"
+
+
+def test_bad_posting_raises_and_leaves_the_ledger_intact():
+    write_csv_rows("transactions.csv", ROWS[:1])
+    store = columnar_store()
+
+    with pytest.raises(ValueError):
+        store.add(dict(ROW, Amount="abc"))
+
+    store.add(ROW)
+    assert [row.description for row in load_columns("transactions.cols").rows()] == ["Coffee", "Sale"]
+
+
+def test_delete_replaces_the_directory():
+    write_csv_rows("transactions.csv", ROWS[:2])
+    store = columnar_store()
+
+    store.delete(store.get_keys()[0])
+    store.add(ROW)
+
+    assert [row.description for row in load_columns("transactions.cols").rows()] == ["Rent", "Sale"]
+    assert sorted(os.listdir(".")) == ["transactions.cols", "transactions.csv"]
@@ -0,0 +1,98 @@
+import os
+
+from file_watcher import FileWatcher
+from storage_backends import CsvBackend, write_csv_rows
+
+HEADER = "Date,Description,Debit,Credit,Amount\n"
+LINE = "2024-01-05,Coffee,Cash [ASSET],Sales Revenue [INCOME],12.50\n"
+
+
+def write(text, mode="w"):
+    with open("data.csv", mode=mode, newline="", encoding="utf-8") as file:
+        file.write(text)
+
+
+def marked_watcher(text=HEADER + LINE, tail_size=16):
+    write(text)
+    watcher = FileWatcher("data.csv", tail_size=tail_size)
+    watcher.mark()
+    return watcher
+
+
+def test_untouched_file_is_unchanged():
+    watcher = marked_watcher()
+    assert watcher.check() == ("unchanged", len(HEADER + LINE))
+
+
+def test_appended_lines_are_reported_from_the_old_end():
+    watcher = marked_watcher()
+    write(LINE, mode="a")
+    assert watcher.check() == ("appended", len(HEADER + LINE))
+
+
+def test_a_new_tail_is_a_change():
+    watcher = marked_watcher()
+    write(HEADER + LINE.replace("12.50", "99.99") + LINE)
+    assert watcher.check() == ("changed", 0)
+
+
+def test_same_size_and_tail_with_a_new_mtime_is_a_change():
+    watcher = marked_watcher(tail_size=4)
+    # The edit is outside the hashed tail, so only the mtime gives it away
+    write(HEADER + LINE.replace("Coffee", "Cookie"))
+    stat = os.stat("data.csv")
+    os.utime("data.csv", ns=(stat.st_atime_ns, watcher.mtime_ns + 1_000_000_000))
+    assert watcher.check() == ("changed", 0)
+
+
+def test_truncated_or_deleted_file_is_a_change():
+    watcher = marked_watcher()
+    write(HEADER)
+    assert watcher.check() == ("changed", 0)
+    os.remove("data.csv")
+    assert watcher.check() == ("changed", 0)
+
+
+def test_growth_after_a_partial_line_is_a_change():
+    watcher = marked_watcher(HEADER + LINE[:10])
+    write(LINE[10:], mode="a")
+    assert watcher.check() == ("changed", 0)
+
+
+def test_unread_or_reset_file_is_a_change():
+    write(HEADER + LINE)
+    watcher = FileWatcher("data.csv")
+    assert watcher.check() == ("changed", 0)
+    watcher.mark()
+    watcher.reset()
+    assert watcher.check() == ("changed", 0)
+
+
+def test_mark_up_to_the_bytes_read():
+    write(HEADER + LINE + LINE)
+    watcher = FileWatcher("data.csv")
+    watcher.mark(len(HEADER + LINE))
+    assert watcher.check() == ("appended", len(HEADER + LINE))
+
+
+def test_csv_backend_reads_only_appended_rows():
+    write(HEADER + LINE)
+    backend = CsvBackend("data.csv", workers=1)
+    backend.load()
+    assert backend.read_changes() == ("unchanged", [])
+
+    write(LINE.replace("Coffee", "Tea"), mode="a")
+    kind, rows = backend.read_changes()
+
+    assert (kind, [row.description for row in rows]) == ("appended", ["Tea"])
+    assert backend.read_changes() == ("unchanged", [])
+
+
+def test_csv_backend_reloads_lines_appended_to_a_file_without_a_header():
+    write("")
+    backend = CsvBackend("data.csv", workers=1)
+    backend.load()
+    write_csv_rows("data.csv", [])
+    write(LINE, mode="a")
+
+    assert backend.read_changes() == ("changed", None)
@@ -0,0 +1,36 @@
+from general_journal import GeneralJournal
+from general_ledger import GeneralLedger
+from transaction_store import TransactionStore
+
+
+def row(day, amount):
+    return {"Date": f"2024-01-{day:02d}", "Description": f"Day {day}", "Debit": "Cash [ASSET]",
+            "Credit": "Sales Revenue [INCOME]", "Amount": amount}
+
+
+def test_running_balances_after_deletions_and_postings():
+    store = TransactionStore.from_rows([row(day, f"{day}.00") for day in range(1, 6)])
+    ledger = GeneralLedger(store)
+    keys = store.get_keys()
+
+    store.delete(keys[3])
+    store.delete(keys[1])
+    store.add(row(9, "100.00"))
+
+    assert [(entry.description, entry.balance) for entry in ledger.get_all_entries()] == [
+        ("Day 1", 100), ("Day 3", 400), ("Day 5", 900), ("Day 9", 10900)]
+    assert ledger.get_totals() == (10900, 10900)
+
+
+def test_journal_date_range_follows_out_of_order_postings_and_deletions():
+    store = TransactionStore.from_rows([row(10, "1.00"), row(20, "2.00")])
+    journal = GeneralJournal(store)
+
+    store.add(row(15, "3.00"))
+    store.add(row(5, "4.00"))
+    store.add(row(15, "5.00"))
+    store.delete(store.get_keys()[2])
+
+    entries = journal.get_journal_entries_by_date_range("2024-01-01", "2024-01-15")
+    assert [entry.description for entry in entries if entry.date] == ["Day 5", "Day 10", "Day 15"]
+    assert [entry.debit for entry in entries if entry.date] == ["4.00", "1.00", "5.00"]
@@ -0,0 +1,14 @@
+import pytest
+
+from benchmarks import CORE_MODULES, import_time
+
+IMPORT_BUDGET_MS = 60
+
+
+@pytest.mark.parametrize("module", CORE_MODULES)
+def test_core_module_imports_fast_without_a_gui_toolkit(module):
+    milliseconds, loaded = import_time(module)
+
+    assert loaded == [], f"{module} imports {', '.join(loaded)}"
+    assert milliseconds is not None, f"python -X importtime reported nothing for {module}"
+    assert milliseconds <= IMPORT_BUDGET_MS, f"{module} takes {milliseconds:.1f} ms to import"
@@ -0,0 +1,32 @@
+import pytest
+
+from money import cents_to_str, format_money, parse_cents
+
+
+@pytest.mark.parametrize("text, cents", [
+    ("1200", 120000),
+    ("12.50", 1250),
+    ("12.5", 1250),
+    ("1.5 ", 150),
+    (" 7 ", 700),
+    ("12.50\n", 1250),
+    ("\t3.25", 325),
+    ("-3.75", -375),
+    ("-3.5", -350),
+    (" -0.5 ", -50),
+    ("1.005", 101),
+    (12.5, 1250),
+])
+def test_parse_cents(text, cents):
+    assert parse_cents(text) == cents
+
+
+@pytest.mark.parametrize("text", ["", "abc", "1.2.3", "nan", "inf", " "])
+def test_parse_cents_rejects_non_numbers(text):
+    with pytest.raises(ValueError):
+        parse_cents(text)
+
+
+def test_cents_to_text():
+    assert cents_to_str(-375) == "-3.75"
+    assert format_money(123456) == "1,234.56"
@@ -0,0 +1,65 @@
+import os
+import runpy
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from conftest import BASE_DIR
+from parallel_csv import PARALLEL_MIN_BYTES, read_header, record_chunks
+
+HEADER = "Date,Description,Debit,Credit,Amount\n"
+BLOCK = ('2024-01-05,Coffee,Cash [ASSET],Sales Revenue [INCOME],12.50\n'
+         '2024-01-06,"Multi ""quoted""\nline, with comma",Rent Expense [EXPENSE],Cash [ASSET],300.00\n')
+
+
+def write_big_csv(path, size):
+    repeat = size // len(BLOCK.encode()) + 1
+    with open(path, mode="w", newline="", encoding="utf-8") as file:
+        file.write(HEADER)
+        file.write(BLOCK * repeat)
+    return repeat * 2
+
+
+def test_chunks_never_split_a_quoted_record(tmp_path):
+    path = tmp_path / "transactions.csv"
+    write_big_csv(path, 20_000)
+    size = os.path.getsize(path)
+    _, start = read_header(path)
+    for count in (2, 7, 50):
+        chunks = record_chunks(path, start, size, count)
+        assert chunks[0][0] == start and chunks[-1][1] == size
+        with open(path, mode="rb") as file:
+            data = file.read()
+        for chunk_start, _ in chunks:
+            assert data[:chunk_start].count(b'"') % 2 == 0
+
+
+def test_main_builds_no_window_when_reimported_by_a_worker():
+    pytest.importorskip("tkinter")
+    # What a spawned pool worker does with the GUI's main script
+    namespace = runpy.run_path(os.path.join(BASE_DIR, "main.py"), run_name="__mp_main__")
+    assert "Lobot" not in namespace and callable(namespace["main"])
+
+
+def test_spawned_pool_load_matches_serial_load(tmp_path):
+    path = tmp_path / "transactions.csv"
+    expected = write_big_csv(path, PARALLEL_MIN_BYTES)
+    script = tmp_path / "load.py"
+    script.write_text(textwrap.dedent(f"""
+        import multiprocessing
+        import sys
+        sys.path.insert(0, {BASE_DIR!r})
+        from storage_backends import CsvBackend
+
+        if __name__ == "__main__":
+            multiprocessing.set_start_method("spawn")
+            _, serial = CsvBackend({str(path)!r}, workers=1).load()
+            _, parallel = CsvBackend({str(path)!r}, workers=2).load()
+            assert [row.values() for row in parallel] == [row.values() for row in serial]
+            print(len(parallel))
+    """))
+    done = subprocess.run([sys.executable, str(script)], capture_output=True, text=True, timeout=600)
+    assert done.returncode == 0, done.stderr
+    assert int(done.stdout.split()[-1]) == expected
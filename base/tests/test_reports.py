@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+import reports
+from storage_backends import CsvBackend, write_csv_rows
+from transaction_store import TransactionStore
+
+ROWS = [
+    {"Date": "2024-01-05", "Description": "Capital", "Debit": "Cash [ASSET]",
+     "Credit": "Owner's Capital [EQUITY]", "Amount": "500.00"},
+    {"Date": "2024-02-06", "Description": "Rent", "Debit": "Rent Expense [EXPENSE]",
+     "Credit": "Cash [ASSET]", "Amount": "120.00"},
+]
+
+
+@pytest.fixture
+def store(monkeypatch):
+    write_csv_rows("transactions.csv", ROWS)
+    store = TransactionStore(CsvBackend("transactions.csv", workers=1))
+    monkeypatch.setattr(reports, "get_store", lambda: store)
+    return store
+
+
+@pytest.mark.parametrize("argv", [
+    ["journal", "--start", "2024-13-01"],
+    ["journal", "--end", "2024-02-30"],
+    ["balance-sheet", "--as-of", "yesterday"],
+])
+def test_bad_dates_are_rejected(store, argv, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        reports.main(argv)
+    assert exit_info.value.code != 0
+    assert "invalid date" in capsys.readouterr().err
+
+
+def test_journal_date_range(store, capsys):
+    assert reports.main(["--format", "csv", "journal", "--start", "2024-2-1", "--end", "2024-02-29"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[1].split(",")[:2] == ["2024-02-06", "Rent"]
+    assert lines[-1] == ",,Totals,120.00,120.00"
+
+
+def test_balance_sheet_writes_no_files(store, capsys):
+    before = set(os.listdir("."))
+    assert reports.main(["balance-sheet", "--as-of", "2024-01-31"]) == 0
+    assert set(os.listdir(".")) == before
+    assert "500.00" in capsys.readouterr().out
+
+
+def test_balance_sheet_saves_snapshots_when_asked(store):
+    assert reports.main(["balance-sheet", "--as-of", "2024-01-31", "--snapshots", "snapshots.json"]) == 0
+    assert os.path.exists("snapshots.json")
+
+
+def test_output_options_after_the_report_name(store, capsys):
+    assert reports.main(["ledger", "--account", "Cash [ASSET]", "--format", "csv", "-o", "cash.csv"]) == 0
+
+    with open("cash.csv", newline="", encoding="utf-8") as file:
+        lines = file.read().splitlines()
+    assert lines[0] == "Date,Description,Debit Account,Credit Account,Debit,Credit,Balance"
+    assert lines[1:3] == ["2024-01-05,Capital,Cash [ASSET],Owner's Capital [EQUITY],500.00,,500.00",
+                          "2024-02-06,Rent,Rent Expense [EXPENSE],Cash [ASSET],,120.00,380.00"]
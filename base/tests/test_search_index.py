@@ -0,0 +1,61 @@
+import threading
+
+import search_index
+from search_index import SearchIndex
+from transaction_store import TransactionStore
+
+ROWS = [
+    {"Date": "2024-01-05", "Description": "Coffee beans", "Debit": "Cash [ASSET]",
+     "Credit": "Sales Revenue [INCOME]", "Amount": "12.50"},
+    {"Date": "2024-01-06", "Description": "Office rent", "Debit": "Rent Expense [EXPENSE]",
+     "Credit": "Cash [ASSET]", "Amount": "300.00"},
+]
+NEW_ROW = {"Date": "2024-02-01", "Description": "Espresso machine", "Debit": "Equipment [ASSET]",
+           "Credit": "Cash [ASSET]", "Amount": "900.00"}
+
+
+def test_postings_and_deletions_update_the_index():
+    store = TransactionStore.from_rows(ROWS)
+    index = SearchIndex(store)
+    assert index.search_keys("coffee") == [0]
+
+    key = store.add(NEW_ROW)
+    store.delete(0)
+
+    assert index.search_keys("coffee") == []
+    assert index.search_keys("espresso") == [key]
+    assert index.search_keys("rent") == [1]
+    assert [row.description for row in index.search("machine")] == ["Espresso machine"]
+
+
+def test_one_and_two_character_terms():
+    store = TransactionStore.from_rows(ROWS)
+    index = SearchIndex(store)
+
+    assert index.search_keys("c") == [0, 1]
+    assert index.search_keys("ff") == [0, 1]
+    assert index.search_keys("Be") == [0]
+    assert index.search_keys("zq") == []
+    assert index.search_keys("") == [0, 1]
+
+
+def test_posting_while_the_index_builds(monkeypatch):
+    store = TransactionStore.from_rows(ROWS)
+    index = SearchIndex(store)
+    posted = []
+
+    def post_meanwhile(name):
+        # Called by the build; another thread posts and deletes before it goes on
+        if not posted:
+            thread = threading.Thread(target=lambda: (posted.append(store.add(NEW_ROW)), store.delete(1)))
+            thread.start()
+            thread.join(timeout=10)
+            assert posted and not thread.is_alive(), "the build held the store lock"
+        return original(name)
+
+    original = search_index.attrgetter
+    monkeypatch.setattr(search_index, "attrgetter", post_meanwhile)
+
+    assert index.search_keys("espresso") == posted
+    assert index.search_keys("rent") == []
+    assert index.search_keys("cash") == [0] + posted
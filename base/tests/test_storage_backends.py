@@ -0,0 +1,72 @@
+import os
+
+from records import TransactionFilter, TransactionRow
+from storage_backends import AppendLogBackend, write_csv_rows
+from transaction_store import TransactionStore
+
+ROWS = [TransactionRow(f"2024-01-{day:02d}", f"Day {day}", "Cash [ASSET]", "Sales Revenue [INCOME]", f"{day}.00")
+        for day in range(1, 7)]
+
+
+def log_store(seed_rows=ROWS):
+    write_csv_rows("transactions.csv", seed_rows)
+    store = TransactionStore(AppendLogBackend("transactions.log", "transactions.csv"))
+    store.load()
+    return store
+
+
+def reopen():
+    backend = AppendLogBackend("transactions.log", "transactions.csv")
+    keys, rows = backend.load()
+    return backend, keys, [row.description for row in rows]
+
+
+def test_seed_then_delete_by_key():
+    store = log_store()
+    assert store.get_keys() == [1, 2, 3, 4, 5, 6]
+
+    store.delete(4)
+    store.delete(1)
+
+    assert reopen()[1:] == ([2, 3, 5, 6], ["Day 2", "Day 3", "Day 5", "Day 6"])
+
+
+def test_ids_continue_after_deleting_the_newest_and_compacting():
+    store = log_store()
+    store.delete(6)
+    store.delete(5)
+
+    store.backend.compact()
+    backend, keys, descriptions = reopen()
+
+    assert (keys, descriptions) == ([1, 2, 3, 4], ["Day 1", "Day 2", "Day 3", "Day 4"])
+    # The newest tombstone survives compaction, so ID 6 is not handed out again
+    assert backend.append(ROWS[0]) == 7
+
+
+def test_background_compaction_keeps_postings_made_meanwhile():
+    store = log_store()
+    store.delete(2)
+    store.delete(3)
+
+    thread = store.backend.compact_in_background()
+    store.add(TransactionRow("2024-01-07", "Posted meanwhile", "Cash [ASSET]", "Sales Revenue [INCOME]", "7.00"))
+    thread.join()
+
+    backend, keys, descriptions = reopen()
+    assert (keys, descriptions) == ([1, 4, 5, 6, 7], ["Day 1", "Day 4", "Day 5", "Day 6", "Posted meanwhile"])
+    with open("transactions.log", encoding="utf-8") as file:
+        assert sum(line.startswith("D,") for line in file) == 0
+    assert not os.path.exists("transactions.log.compact")
+    assert backend.append(ROWS[0]) == 8
+
+
+def test_iter_transactions_skips_deleted_and_filters():
+    store = log_store()
+    store.delete(3)
+
+    streamed = list(store.backend.iter_transactions(TransactionFilter.build("2024-01-02", "2024-01-05")))
+
+    assert [(record.key, record.description, record.amount) for record in streamed] == [
+        (2, "Day 2", 200), (4, "Day 4", 400), (5, "Day 5", 500)]
+    assert [record.key for record in store.backend.iter_transactions(TransactionFilter(min_cents=600))] == [6]
@@ -0,0 +1,69 @@
+import pytest
+
+from storage_backends import CsvBackend, read_csv_rows, write_csv_rows
+from transaction_store import TransactionStore, make_backend
+
+ROWS = [
+    {"Date": "2024-01-05", "Description": "Coffee", "Debit": "Cash [ASSET]",
+     "Credit": "Sales Revenue [INCOME]", "Amount": "12.50"},
+    {"Date": "2024-01-06", "Description": "Rent", "Debit": "Rent Expense [EXPENSE]",
+     "Credit": "Cash [ASSET]", "Amount": "300.00"},
+]
+OUTSIDE_LINE = "2024-01-07,Written elsewhere,Cash [ASSET],Service Revenue [INCOME],45.00\n"
+
+
+def csv_store(path="transactions.csv"):
+    write_csv_rows(path, ROWS)
+    store = TransactionStore(CsvBackend(path, workers=1))
+    store.load()
+    return store
+
+
+def test_delete_keeps_rows_another_writer_appended():
+    store = csv_store()
+    with open("transactions.csv", mode="a", newline="", encoding="utf-8") as file:
+        file.write(OUTSIDE_LINE)
+
+    store.delete(store.get_keys()[0])
+
+    descriptions = [row["Description"] for row in read_csv_rows("transactions.csv")]
+    assert descriptions == ["Rent", "Written elsewhere"]
+    assert [row.description for row in store.get_rows()] == descriptions
+
+
+def test_delete_after_an_outside_rewrite_refuses_and_reloads():
+    store = csv_store()
+    key = store.get_keys()[0]
+    write_csv_rows("transactions.csv", ROWS[1:])
+
+    with pytest.raises(KeyError):
+        store.delete(key)
+
+    assert [row["Description"] for row in read_csv_rows("transactions.csv")] == ["Rent"]
+    assert [row.description for row in store.get_rows()] == ["Rent"]
+
+
+@pytest.mark.parametrize("mode, backend_class", [
+    ("csv", "storage_backends.CsvBackend"),
+    ("log", "storage_backends.AppendLogBackend"),
+    ("sqlite", "sqlite_backend.SQLiteBackend"),
+    ("columnar", "columnar_storage.ColumnarBackend"),
+])
+def test_make_backend_selects_each_storage_mode(mode, backend_class):
+    backend = make_backend(mode)
+    assert f"{type(backend).__module__}.{type(backend).__name__}" == backend_class
+
+
+def test_make_backend_rejects_unknown_modes():
+    with pytest.raises(ValueError):
+        make_backend("cvs")
+
+
+def test_refresh_reloads_a_file_that_was_empty_when_read():
+    open("transactions.csv", mode="w").close()
+    store = TransactionStore(CsvBackend("transactions.csv", workers=1))
+    store.load()
+    write_csv_rows("transactions.csv", ROWS)
+
+    assert store.refresh() == "changed"
+    assert [row.description for row in store.get_rows()] == ["Coffee", "Rent"]
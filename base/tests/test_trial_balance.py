@@ -0,0 +1,61 @@
+from accounts_manager import AccountsManager
+from sqlite_backend import SQLiteBackend
+from storage_backends import write_csv_rows
+from transaction_store import TransactionStore
+from trial_balance import TrialBalance
+
+ROWS = [
+    {"Date": "2024-01-05", "Description": "Capital", "Debit": "Cash [ASSET]",
+     "Credit": "Owner's Capital [EQUITY]", "Amount": "500.00"},
+    {"Date": "2024-01-06", "Description": "Rent", "Debit": "Rent Expense [EXPENSE]",
+     "Credit": "Cash [ASSET]", "Amount": "120.00"},
+]
+
+
+def make_trial_balance(rows=ROWS):
+    return TrialBalance(AccountsManager(TransactionStore.from_rows(rows)))
+
+
+def test_lines_and_totals():
+    trial_balance = make_trial_balance()
+    lines = trial_balance.get_lines()
+    assert [(line.account, line.debit, line.credit) for line in lines] == [
+        ("Cash [ASSET]", 38000, 0),
+        ("Owner's Capital [EQUITY]", 0, 50000),
+        ("Rent Expense [EXPENSE]", 12000, 0),
+    ]
+    assert tuple(trial_balance.get_totals(lines)) == (50000, 50000)
+    assert tuple(trial_balance.get_totals(trial_balance.get_lines(postings=True))) == (62000, 62000)
+    assert trial_balance.find_problems() == []
+
+
+def test_postings_to_an_account_outside_the_chart_are_flagged():
+    trial_balance = make_trial_balance(ROWS + [
+        {"Date": "2024-01-07", "Description": "Typo", "Debit": "Csh [ASSET]",
+         "Credit": "Cash [ASSET]", "Amount": "5.00"},
+    ])
+    assert trial_balance.find_problems() == ["Csh [ASSET] is not in the chart of accounts"]
+
+
+def test_a_balance_cache_out_of_step_with_the_rows_is_flagged():
+    trial_balance = make_trial_balance()
+    manager = trial_balance.accounts_manager
+    manager.get_account_balances()
+    manager._adjust_balance(manager.chart.find("Cash [ASSET]"), 100)
+    assert trial_balance.find_problems() == ["Cached balance of Cash [ASSET] is off by 1.00"]
+
+
+def test_two_stores_sharing_a_database_each_balance_their_own_rows():
+    write_csv_rows("transactions.csv", ROWS)
+    store_a = TransactionStore(SQLiteBackend("transactions.db", "transactions.csv"))
+    store_b = TransactionStore(SQLiteBackend("transactions.db", "transactions.csv"))
+    trial_balance = TrialBalance(AccountsManager(store_a))
+    store_a.load()
+    store_b.load()
+
+    store_b.add({"Date": "2024-01-07", "Description": "Sale", "Debit": "Cash [ASSET]",
+                 "Credit": "Sales Revenue [INCOME]", "Amount": "40.00"})
+
+    balances = trial_balance.accounts_manager.get_account_balances()
+    assert (balances["Cash [ASSET]"], balances["Sales Revenue [INCOME]"]) == (38000, 0)
+    assert trial_balance.find_problems() == []
@@ -1,15 +1,17 @@
 import csv
 import os
 from datetime import datetime
+from money import cents_to_str, parse_cents
+from records import TransactionFilter
+from transaction_store import FILENAME, get_store
 
-FILENAME = "transactions.csv"
 if not os.path.exists(FILENAME):
     with open(FILENAME, mode="w", newline="") as file:
         writer = csv.writer(file)
         writer.writerow(["Date", "Description", "Debit", "Credit", "Amount"])
 
 def add_transaction(date, description, debit, credit, amount):
-    """Add one transaction to the CSV file."""
+    """Add one transaction to the transaction store and return its key."""
     try:
 
         if not all([date, description, debit, credit, amount]):
@@ -21,35 +23,65 @@ def add_transaction(date, description, debit, credit, amount):
             raise ValueError("Date must be in YYYY-MM-DD format")
 
         try:
-            float(amount)
+            cents = parse_cents(amount)
         except ValueError:
             raise ValueError("Amount must be a valid number")
         
-        with open(FILENAME, mode="a", newline="", encoding='utf-8') as file:
-            writer = csv.writer(file)
-            writer.writerow([date, description, debit, credit, amount])
-        print("✅ Transaction saved to transactions.csv!")
+        key = get_store().add({
+            "Date": date,
+            "Description": description,
+            "Debit": debit,
+            "Credit": credit,
+            "Amount": cents_to_str(cents)
+        })
+        print("✅ Transaction saved!")
+        return key
         
     except Exception as e:
         print(f"❌ Error saving transaction: {str(e)}")
         raise
 
 def get_all_transactions():
-    """Return a list of all saved transactions as dictionaries."""
+    """Return a list of all saved transactions as TransactionRow records."""
     try:
-        if not os.path.exists(FILENAME):
-            return []
-            
-        with open(FILENAME, mode="r", newline="", encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            transactions = []
-            for row in reader:
-                if all(key in row for key in ["Date", "Description", "Debit", "Credit", "Amount"]):
-                    transactions.append(row)
-                else:
-                    print(f"Warning: Skipping malformed transaction row: {row}")
-            return transactions
-            
+        return list(get_store().get_rows())
     except Exception as e:
         print(f"❌ Error reading transactions: {str(e)}")
         return []
+
+def iter_transactions(start_date=None, end_date=None, account=None, min_amount=None, max_amount=None):
+    """Yield matching transactions one at a time as Transaction records.
+
+    Dates are inclusive YYYY-MM-DD bounds, `account` matches the debit or
+    credit side, and amounts are inclusive bounds. The filters are applied
+    inside the storage scan, so a report that only sums or prints records
+    runs in constant memory however large the ledger is.
+    """
+    conditions = TransactionFilter.build(start_date, end_date, account, min_amount, max_amount)
+    return get_store().iter_transactions(conditions)
+
+def export_transactions(filename, **filters):
+    """Stream the transactions matching `filters` (see iter_transactions) to a CSV file; return the count."""
+    count = 0
+    try:
+        with open(filename, mode="w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["Date", "Description", "Debit", "Credit", "Amount"])
+            for record in iter_transactions(**filters):
+                writer.writerow([record.date, record.description, record.debit, record.credit,
+                                 cents_to_str(record.amount)])
+                count += 1
+        print(f"✅ Exported {count} transactions to {filename}")
+        return count
+    except Exception as e:
+        print(f"❌ Error exporting transactions: {str(e)}")
+        raise
+
+def remove_transaction(key):
+    """Remove the one transaction stored under `key`."""
+    try:
+        get_store().delete(key)
+
+    except Exception as e:
+        print(f"❌ Error deleting transaction: {str(e)}")
+        raise
@@ -0,0 +1,290 @@
+import bisect
+import os
+import threading
+
+from records import NO_FILTER, TransactionRow, filter_rows
+from storage_backends import FILENAME, LOG_FILENAME, REQUIRED_FIELDS, AppendLogBackend, CsvBackend
+
+# "csv" keeps transactions.csv as the only file; "log" uses the append-only
+# journal, "sqlite" an indexed database and "columnar" the binary column files
+STORAGE_MODES = ("csv", "log", "sqlite", "columnar")
+STORAGE_MODE = os.environ.get("ACCOUNTING_STORAGE", "csv")
+
+
+# Usa ra ka kopya sa transactions.csv sa memorya para sa tanan views (Bisaya)
+class TransactionStore:
+    """Process-wide, in-memory copy of the saved transactions.
+
+    The storage backend (transactions.csv by default) is read once, on first
+    access. Every view (transaction list, accounts, journal, ledger) reads
+    the same parsed rows instead of opening the file on its own, and every
+    write goes through add() and delete() so disk and memory stay in step.
+    Rows are slotted TransactionRow records (see records.py), not dicts.
+
+    Each row also gets an integer key that never changes while the process
+    runs (the log backend persists it as the transaction ID). Keys grow in
+    file order, so sorting keys gives rows in file order.
+
+    Views that keep derived data (balances, journal lines, running balances)
+    subscribe to the store and are told about each change as it happens:
+    ``listener("add", row, index, key)``, ``listener("remove", row, index, key)``
+    or ``listener("reload", None, None, None)`` when every row was replaced.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend
+        self._rows = []
+        self._keys = []
+        self._by_key = {}
+        self._next_key = 0
+        self._loaded = False
+        self.lock = threading.RLock()
+        self._listeners = []
+        # Set by search_index.get_search_index so every view shares one index
+        self.search_index = None
+        # Set by balance_columns.get_balance_columns and
+        # balance_snapshots.get_balance_snapshots, likewise
+        self.balance_columns = None
+        self.balance_snapshots = None
+
+    @classmethod
+    def from_rows(cls, rows, backend=None):
+        """Build a store over rows that are already in memory."""
+        store = cls(backend)
+        store._set_rows([TransactionRow.from_mapping(row) for row in rows])
+        store._loaded = True
+        return store
+
+    def _set_rows(self, rows, keys=None):
+        if keys is None:
+            keys = list(range(self._next_key, self._next_key + len(rows)))
+        self._rows = rows
+        self._keys = keys
+        self._by_key = dict(zip(keys, rows))
+        if keys:
+            self._next_key = max(self._next_key, keys[-1] + 1)
+
+    def subscribe(self, listener):
+        """Call `listener(event, row, index, key)` after every change to the rows."""
+        with self.lock:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        with self.lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _notify(self, event, row=None, index=None, key=None):
+        for listener in list(self._listeners):
+            try:
+                listener(event, row, index, key)
+            except Exception as e:
+                print(f"Error updating transaction listener: {e}")
+
+    def load(self):
+        """Parse the file if it has not been parsed yet."""
+        with self.lock:
+            if not self._loaded:
+                self.reload()
+
+    def reload(self):
+        """Re-read the backend, replacing the cached rows."""
+        with self.lock:
+            if self.backend is not None:
+                try:
+                    keys, rows = self.backend.load()
+                    self._set_rows(rows, keys)
+                except Exception as e:
+                    print(f"❌ Error reading transactions: {str(e)}")
+                    self._set_rows([])
+            self._loaded = True
+            self._notify("reload")
+
+    def refresh(self):
+        """Pick up changes another program made to the backend; return what was found.
+
+        Backends with read_changes() report "unchanged" (nothing to do),
+        "appended" (only the new rows are parsed and announced as "add"
+        events) or "changed" (everything is reloaded). Other backends are
+        always reloaded.
+        """
+        with self.lock:
+            if not self._loaded:
+                self.load()
+                return "changed"
+            if self.backend is None:
+                return "unchanged"
+
+            read_changes = getattr(self.backend, "read_changes", None)
+            kind, rows = "changed", None
+            if read_changes is not None:
+                try:
+                    kind, rows = read_changes()
+                except Exception as e:
+                    print(f"❌ Error checking transactions for changes: {str(e)}")
+                    kind = "changed"
+
+            if kind == "appended":
+                for row in rows:
+                    self._append_cached(row, None)
+            elif kind == "changed":
+                self.reload()
+            return kind
+
+    def invalidate(self):
+        """Forget the cached rows; the next access reads the backend again."""
+        with self.lock:
+            if self.backend is None:
+                return
+            self._set_rows([])
+            self._loaded = False
+            self._notify("reload")
+
+    def get_rows(self):
+        """Return the cached rows (the list itself, do not mutate it)."""
+        with self.lock:
+            self.load()
+            return self._rows
+
+    def get_keys(self):
+        """Return the keys of the cached rows, parallel to get_rows()."""
+        with self.lock:
+            self.load()
+            return self._keys
+
+    def get_items(self):
+        """Return a snapshot list of (key, row) pairs in file order."""
+        with self.lock:
+            self.load()
+            return list(zip(self._keys, self._rows))
+
+    def iter_transactions(self, conditions=NO_FILTER):
+        """Yield the Transaction records that meet `conditions`, in file order.
+
+        Once the store is loaded this filters the cached rows. Before that it
+        streams from the backend, so a report over a huge ledger never holds
+        more than one record at a time and does not fill the cache.
+        """
+        with self.lock:
+            loaded = self._loaded or self.backend is None
+            if loaded:
+                keys, rows = list(self._keys), list(self._rows)
+        if loaded:
+            yield from filter_rows(zip(keys, rows), conditions)
+            return
+
+        stream = getattr(self.backend, "iter_transactions", None)
+        if stream is None:
+            self.load()
+            yield from self.iter_transactions(conditions)
+            return
+        yield from stream(conditions)
+
+    def get_row(self, key):
+        """Return the row stored under `key`, or None if it was deleted."""
+        return self._by_key.get(key)
+
+    def add(self, row):
+        """Write a new transaction to the backend and the cache; return its key."""
+        with self.lock:
+            self.load()
+            row = TransactionRow.from_mapping(row)
+            key = self.backend.append(row) if self.backend is not None else None
+            return self._append_cached(row, key)
+
+    def add_many(self, rows):
+        """Write several transactions with one backend append; return their keys.
+
+        Backends without append_many() get one append() per row. Listeners
+        still see one "add" event per row.
+        """
+        with self.lock:
+            self.load()
+            rows = [row if type(row) is TransactionRow else TransactionRow.from_mapping(row) for row in rows]
+            if not rows:
+                return []
+            keys = None
+            if self.backend is not None:
+                append_many = getattr(self.backend, "append_many", None)
+                if append_many is not None:
+                    keys = append_many(rows)
+                else:
+                    keys = [self.backend.append(row) for row in rows]
+            if keys is None or keys[0] is None:
+                keys = list(range(self._next_key, self._next_key + len(rows)))
+            self._next_key = max(self._next_key, keys[-1] + 1)
+
+            # Extend the cache in one go; per-row events only if someone listens
+            start = len(self._rows)
+            self._rows.extend(rows)
+            self._keys.extend(keys)
+            self._by_key.update(zip(keys, rows))
+            if self._listeners:
+                for index, (row, key) in enumerate(zip(rows, keys), start):
+                    self._notify("add", row, index, key)
+            return keys
+
+    def _append_cached(self, row, key):
+        if key is None:
+            key = self._next_key
+        self._next_key = max(self._next_key, key + 1)
+        self._rows.append(row)
+        self._keys.append(key)
+        self._by_key[key] = row
+        self._notify("add", row, len(self._rows) - 1, key)
+        return key
+
+    def delete(self, key):
+        """Delete exactly one transaction, identified by its key."""
+        with self.lock:
+            self.load()
+            # Backends that rewrite the file from the cache (CSV) must not drop
+            # rows another program appended: take those in first
+            if getattr(self.backend, "read_changes", None) is not None and self.refresh() == "changed":
+                raise KeyError(f"Transactions were reloaded from disk; key {key} is out of date")
+            index = bisect.bisect_left(self._keys, key)
+            if index == len(self._keys) or self._keys[index] != key:
+                raise KeyError(f"No transaction with key {key}")
+            row = self._rows.pop(index)
+            self._keys.pop(index)
+            if self.backend is not None:
+                try:
+                    self.backend.delete(key, row, self._rows)
+                except Exception:
+                    self._rows.insert(index, row)
+                    self._keys.insert(index, key)
+                    raise
+            del self._by_key[key]
+            self._notify("remove", row, index, key)
+
+    def __len__(self):
+        return len(self.get_rows())
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Return the shared TransactionStore for this process."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = TransactionStore(make_backend(STORAGE_MODE))
+        return _store
+
+
+def make_backend(mode):
+    """Return the storage backend for a STORAGE_MODE value; raise ValueError for an unknown one."""
+    if mode == "csv":
+        return CsvBackend(FILENAME)
+    if mode == "log":
+        return AppendLogBackend(LOG_FILENAME, seed_csv=FILENAME)
+    if mode == "sqlite":
+        from sqlite_backend import SQLiteBackend
+        return SQLiteBackend(seed_csv=FILENAME)
+    if mode == "columnar":
+        # Imported only when selected, like every optional backend
+        from columnar_storage import ColumnarBackend
+        return ColumnarBackend(seed_csv=FILENAME)
+    raise ValueError(f"Unknown ACCOUNTING_STORAGE {mode!r}; use one of {', '.join(STORAGE_MODES)}")
@@ -0,0 +1,86 @@
+from typing import NamedTuple
+
+from accounts_manager import AccountsManager
+from balance_columns import get_balance_columns
+from money import format_money
+
+
+class TrialBalanceLine(NamedTuple):
+    """One account's row of the trial balance; amounts are integer cents."""
+    account: str
+    account_type: str
+    debit: int
+    credit: int
+
+
+class TrialBalanceTotals(NamedTuple):
+    """Grand totals of the debit and credit columns."""
+    debits: int
+    credits: int
+
+
+# Trial balance: debit ug credit sa matag account, ug ang kinatibuk-an (Bisaya)
+class TrialBalance:
+    """Debit and credit columns per account, with grand totals.
+
+    get_lines() puts each account's balance in its debit or credit column.
+    It reads AccountsManager's balance cache, which is built by one grouped
+    sum over the balance columns and then kept up to date per posting, so
+    after the first call it costs one step per account, not per row.
+    get_lines(postings=True) instead gives each account's total debit and
+    total credit postings, from one pass over the same columns.
+
+    Every transaction posts one amount to both sides, so the two column
+    totals always agree and comparing them proves nothing. find_problems()
+    checks what can actually go wrong instead.
+    """
+
+    def __init__(self, accounts_manager=None):
+        self.accounts_manager = accounts_manager if accounts_manager is not None else AccountsManager()
+        self.store = self.accounts_manager.store
+        self.chart = self.accounts_manager.chart
+
+    def get_lines(self, postings=False):
+        """Accounts that have a balance (or postings), in chart order."""
+        manager = self.accounts_manager
+        lines = []
+        if postings:
+            debits, credits = get_balance_columns(self.store).posting_totals_by_id()
+            for account_name, debit, credit in zip(self.chart.names, debits, credits):
+                if debit or credit:
+                    lines.append(TrialBalanceLine(account_name, manager.get_account_type(account_name), debit, credit))
+            return lines
+
+        for account_name, balance in manager.get_account_balances().items():
+            if balance > 0:
+                lines.append(TrialBalanceLine(account_name, manager.get_account_type(account_name), balance, 0))
+            elif balance < 0:
+                lines.append(TrialBalanceLine(account_name, manager.get_account_type(account_name), 0, -balance))
+        return lines
+
+    def find_problems(self):
+        """Reasons not to trust the trial balance, as messages; empty when there are none.
+
+        One pass over the posted rows' columns checks that every account
+        with postings is in the chart of accounts (others are left out of
+        the balance sheet and the per-type totals), and that the cached
+        balance of every account equals its debit postings minus its credit
+        postings.
+        """
+        with self.store.lock:
+            debits, credits = get_balance_columns(self.store).posting_totals_by_id()
+            cached = self.accounts_manager.get_account_balances()
+        problems = []
+        for account_name, account_type, debit, credit in zip(self.chart.names, self.chart.types, debits, credits):
+            if account_type is None and (debit or credit):
+                problems.append(f"{account_name} is not in the chart of accounts")
+            drift = cached[account_name] - (debit - credit)
+            if drift:
+                problems.append(f"Cached balance of {account_name} is off by {format_money(drift)}")
+        return problems
+
+    def get_totals(self, lines=None):
+        """Grand totals of the debit and credit columns"""
+        if lines is None:
+            lines = self.get_lines()
+        return TrialBalanceTotals(sum(line.debit for line in lines), sum(line.credit for line in lines))
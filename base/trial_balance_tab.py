@@ -0,0 +1,119 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+from money import format_money
+
+
+# Nag-set up sa Trial Balance tab: debit ug credit sa matag account (Bisaya)
+def create_trial_balance_tab(tab, trial_balance):
+    """Render the Trial Balance tab: one row per account, grand totals and a balance check.
+
+    Returns the function that fills the tab in, for the caller to run once
+    the data is loaded.
+    """
+    title_label = tk.Label(
+        tab,
+        text="🧮 TRIAL BALANCE",
+        font=("Segoe UI", 24, "bold"),
+        bg="#f0f2f5",
+        fg="#2c3e50"
+    )
+    title_label.pack(pady=(20, 10))
+
+    options_frame = tk.Frame(tab, bg="#f0f2f5")
+    options_frame.pack(pady=(0, 5))
+
+    show_postings = tk.BooleanVar(value=False)
+    tk.Checkbutton(
+        options_frame,
+        text="Show total debit and credit postings instead of balances",
+        variable=show_postings,
+        command=lambda: populate_trial_balance(),
+        font=("Segoe UI", 12),
+        bg="#f0f2f5",
+        fg="#2c3e50",
+        activebackground="#f0f2f5"
+    ).pack(side="left")
+
+    container = tk.Frame(tab, bg="#ffffff", bd=2, relief="solid")
+    container.pack(fill="both", expand=True, padx=20, pady=10)
+
+    columns = ("Account", "Type", "Debit", "Credit")
+    trial_tree = ttk.Treeview(container, columns=columns, show="headings", height=16)
+    for col, width in zip(columns, [320, 160, 180, 180]):
+        trial_tree.heading(col, text=col)
+        trial_tree.column(col, width=width, anchor="e" if col in ("Debit", "Credit") else "w")
+    trial_tree.pack(fill="both", expand=True, padx=10, pady=10)
+
+    totals_label = tk.Label(
+        tab,
+        text="Total Debits: ₱0.00   |   Total Credits: ₱0.00",
+        font=("Segoe UI", 14, "bold"),
+        bg="#f0f2f5",
+        fg="#2c3e50"
+    )
+    totals_label.pack(pady=(0, 5))
+
+    check_label = tk.Label(
+        tab,
+        text="",
+        font=("Segoe UI", 14, "bold"),
+        bg="#f0f2f5",
+        fg="#27ae60"
+    )
+    check_label.pack(pady=(0, 10))
+
+    def populate_trial_balance():
+        try:
+            for item in trial_tree.get_children():
+                trial_tree.delete(item)
+
+            lines = trial_balance.get_lines(postings=show_postings.get())
+            totals = trial_balance.get_totals(lines)
+            problems = trial_balance.find_problems()
+
+            for line in lines:
+                trial_tree.insert(
+                    "",
+                    "end",
+                    values=(
+                        line.account,
+                        line.account_type,
+                        f"₱{format_money(line.debit)}" if line.debit else "",
+                        f"₱{format_money(line.credit)}" if line.credit else ""
+                    )
+                )
+
+            totals_label.config(
+                text=f"Total Debits: ₱{format_money(totals.debits)}   |   Total Credits: ₱{format_money(totals.credits)}"
+            )
+            if not problems:
+                check_label.config(text="✅ Every account is in the chart and matches its postings", fg="#27ae60")
+            else:
+                more = f" (and {len(problems) - 1} more)" if len(problems) > 1 else ""
+                check_label.config(text=f"❌ {problems[0]}{more}", fg="#c0392b")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load trial balance: {str(e)}")
+
+    def refresh_trial_balance():
+        # Re-reads the transactions only if the file changed on disk
+        trial_balance.store.refresh()
+        populate_trial_balance()
+
+    refresh_trial_btn = tk.Button(
+        tab,
+        text="🔄 Refresh Trial Balance",
+        command=refresh_trial_balance,
+        font=("Segoe UI", 14, "bold"),
+        bg="#3498db",
+        fg="white",
+        padx=20,
+        pady=10,
+        relief="flat",
+        bd=0,
+        cursor="hand2",
+        activebackground="#2980b9",
+        activeforeground="white"
+    )
+    refresh_trial_btn.pack(pady=(0, 20))
+
+    return populate_trial_balance
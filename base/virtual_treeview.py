@@ -0,0 +1,136 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+# Treeview nga ang makita ra nga mga linya ang gi-insert (Bisaya)
+class VirtualTreeview(ttk.Frame):
+    """A Treeview plus scrollbar that only materialises the visible rows.
+
+    The table holds a plain Python sequence of rows and a ``formatter`` that
+    turns one row into the tuple of column values. Only as many Treeview
+    items as fit on screen exist; scrolling rewrites their values from the
+    sequence instead of inserting and deleting items, so a 100k-row result
+    costs the same to show as a 30-row one.
+
+    The inner ``ttk.Treeview`` is available as ``.tree`` for headings,
+    column widths and event bindings.
+    """
+
+    def __init__(self, parent, columns, formatter=None, style=None, height=25, **tree_options):
+        super().__init__(parent)
+        self.formatter = formatter or tuple
+        self.style_name = style or "Treeview"
+
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=height, **tree_options)
+        if style:
+            self.tree.configure(style=style)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", expand=True, fill="both")
+
+        self._rows = []
+        self._footer = None
+        self._offset = 0
+        self._visible = height
+        self._selected_index = None
+
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda event: self.scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda event: self.scroll_by(3))
+        self.tree.bind("<Prior>", lambda event: self.scroll_by(-self._visible))
+        self.tree.bind("<Next>", lambda event: self.scroll_by(self._visible))
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+
+    def __len__(self):
+        return len(self._rows) + (1 if self._footer is not None else 0)
+
+    def set_rows(self, rows, footer=None):
+        """Show `rows` (any sequence), optionally followed by a fixed `footer` values tuple."""
+        self._rows = rows
+        self._footer = footer
+        self._selected_index = None
+        self._offset = 0
+        self._render()
+
+    def _row_values(self, index):
+        if index < len(self._rows):
+            return self.formatter(self._rows[index])
+        return self._footer
+
+    def _row_height(self):
+        try:
+            return int(ttk.Style().lookup(self.style_name, "rowheight") or 20)
+        except (tk.TclError, ValueError):
+            return 20
+
+    def _on_configure(self, event):
+        # One row's worth of space goes to the headings
+        visible = max(1, event.height // self._row_height() - 1)
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    def _render(self):
+        total = len(self)
+        self._offset = max(0, min(self._offset, total - self._visible))
+        count = min(self._visible, total - self._offset)
+
+        items = self.tree.get_children()
+        if len(items) > count:
+            self.tree.delete(*items[count:])
+        for slot in range(count):
+            values = self._row_values(self._offset + slot)
+            iid = str(slot)
+            if self.tree.exists(iid):
+                self.tree.item(iid, values=values)
+            else:
+                self.tree.insert("", "end", iid=iid, values=values)
+
+        selected = self._selected_index
+        if selected is not None and self._offset <= selected < self._offset + count:
+            self.tree.selection_set(str(selected - self._offset))
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+
+        if total:
+            self.scrollbar.set(self._offset / total, (self._offset + count) / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_by(self, rows):
+        self._offset += rows
+        self._render()
+        return "break"
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self._offset = int(float(amount) * len(self))
+            self._render()
+        elif action == "scroll":
+            step = self._visible if unit == "pages" else 1
+            self.scroll_by(int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        return self.scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_select(self, event):
+        selection = self.tree.selection()
+        if selection:
+            self._selected_index = self._offset + int(selection[0])
+
+    def select(self, iid):
+        """Select a visible item and remember which row it shows."""
+        self.tree.selection_set(iid)
+        self._selected_index = self.index_of(iid)
+
+    def index_of(self, iid):
+        """Map a visible Treeview item id back to its position in the rows."""
+        return self._offset + int(iid)
+
+    def selected_row(self):
+        """Return the selected row from the sequence, or None (the footer is not a row)."""
+        index = self._selected_index
+        if index is None or index >= len(self._rows):
+            return None
+        return self._rows[index]